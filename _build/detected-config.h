@@ -0,0 +1,22 @@
+#define SIZEOF_INT 4
+#define SIZEOF_LONG 8
+#define SIZEOF_VOID_P 8
+#define SIZEOF_SHORT 2
+#define SIZEOF_FLOAT 4
+#define SIZEOF_DOUBLE 8
+#define SIZEOF_SIZE_T 8
+#define SIZEOF_FPOS_T 16
+#define SIZEOF_PID_T 4
+#define SIZEOF_OFF_T 8
+#define SIZEOF_TIME_T 8
+#define HAVE_LONG_LONG 1
+#define SIZEOF_LONG_LONG 8
+#define HAVE_LONG_DOUBLE 1
+#define SIZEOF_LONG_DOUBLE 16
+#define HAVE_C99_BOOL 1
+#define SIZEOF__BOOL 1
+#define HAVE_WCHAR_H 1
+#define SIZEOF_WCHAR_T 4
+#define VA_LIST_IS_ARRAY 1
+#define HAVE_PTY_H 1
+#define HAVE_STAT_TV_NSEC 1
@@ -0,0 +1,305 @@
+
+from frontend.args import _Attributes
+from _devbuild.gen.runtime_asdl import (
+   value, value_e, value_t, value__Bool, value__Int, value__Float, value__Str,
+)
+from typing import cast, Dict, Optional
+
+
+class cd(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.L = cast(value__Bool, attrs['L']).b  # type: bool
+    self.P = cast(value__Bool, attrs['P']).b  # type: bool
+
+
+class command(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.v = cast(value__Bool, attrs['v']).b  # type: bool
+
+
+class compadjust(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    val0 = attrs['n']
+    self.n = None if val0.tag_() == value_e.Undef else cast(value__Str, val0).s  # type: Optional[str]
+    self.s = cast(value__Bool, attrs['s']).b  # type: bool
+
+
+class compgen(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    val0 = attrs['F']
+    self.F = None if val0.tag_() == value_e.Undef else cast(value__Str, val0).s  # type: Optional[str]
+    val1 = attrs['P']
+    self.P = None if val1.tag_() == value_e.Undef else cast(value__Str, val1).s  # type: Optional[str]
+    val2 = attrs['S']
+    self.S = None if val2.tag_() == value_e.Undef else cast(value__Str, val2).s  # type: Optional[str]
+    val3 = attrs['W']
+    self.W = None if val3.tag_() == value_e.Undef else cast(value__Str, val3).s  # type: Optional[str]
+    val4 = attrs['X']
+    self.X = None if val4.tag_() == value_e.Undef else cast(value__Str, val4).s  # type: Optional[str]
+
+
+class complete(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.D = cast(value__Bool, attrs['D']).b  # type: bool
+    self.E = cast(value__Bool, attrs['E']).b  # type: bool
+    val2 = attrs['F']
+    self.F = None if val2.tag_() == value_e.Undef else cast(value__Str, val2).s  # type: Optional[str]
+    val3 = attrs['P']
+    self.P = None if val3.tag_() == value_e.Undef else cast(value__Str, val3).s  # type: Optional[str]
+    val4 = attrs['S']
+    self.S = None if val4.tag_() == value_e.Undef else cast(value__Str, val4).s  # type: Optional[str]
+    val5 = attrs['W']
+    self.W = None if val5.tag_() == value_e.Undef else cast(value__Str, val5).s  # type: Optional[str]
+    val6 = attrs['X']
+    self.X = None if val6.tag_() == value_e.Undef else cast(value__Str, val6).s  # type: Optional[str]
+
+
+class dirs(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.c = cast(value__Bool, attrs['c']).b  # type: bool
+    self.l = cast(value__Bool, attrs['l']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+    self.v = cast(value__Bool, attrs['v']).b  # type: bool
+
+
+class echo(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.e = cast(value__Bool, attrs['e']).b  # type: bool
+    self.n = cast(value__Bool, attrs['n']).b  # type: bool
+
+
+class export_(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.f = cast(value__Bool, attrs['f']).b  # type: bool
+    self.n = cast(value__Bool, attrs['n']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+
+
+class hash(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.r = cast(value__Bool, attrs['r']).b  # type: bool
+
+
+class history(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.c = cast(value__Bool, attrs['c']).b  # type: bool
+    val1 = attrs['d']
+    self.d = -1 if val1.tag_() == value_e.Undef else cast(value__Int, val1).i  # type: int
+
+
+class jobs(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.debug = cast(value__Bool, attrs['debug']).b  # type: bool
+    self.l = cast(value__Bool, attrs['l']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+
+
+class main(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    val0 = attrs['ast_format']
+    self.ast_format = None if val0.tag_() == value_e.Undef else cast(value__Str, val0).s  # type: Optional[str]
+    val1 = attrs['c']
+    self.c = None if val1.tag_() == value_e.Undef else cast(value__Str, val1).s  # type: Optional[str]
+    val2 = attrs['completion_display']
+    self.completion_display = None if val2.tag_() == value_e.Undef else cast(value__Str, val2).s  # type: Optional[str]
+    val3 = attrs['debug_file']
+    self.debug_file = None if val3.tag_() == value_e.Undef else cast(value__Str, val3).s  # type: Optional[str]
+    self.headless = cast(value__Bool, attrs['headless']).b  # type: bool
+    self.help = cast(value__Bool, attrs['help']).b  # type: bool
+    self.i = cast(value__Bool, attrs['i']).b  # type: bool
+    self.l = cast(value__Bool, attrs['l']).b  # type: bool
+    val8 = attrs['location_start_line']
+    self.location_start_line = -1 if val8.tag_() == value_e.Undef else cast(value__Int, val8).i  # type: int
+    val9 = attrs['location_str']
+    self.location_str = None if val9.tag_() == value_e.Undef else cast(value__Str, val9).s  # type: Optional[str]
+    self.login = cast(value__Bool, attrs['login']).b  # type: bool
+    self.one_pass_parse = cast(value__Bool, attrs['one_pass_parse']).b  # type: bool
+    self.print_status = cast(value__Bool, attrs['print_status']).b  # type: bool
+    val13 = attrs['rcfile']
+    self.rcfile = None if val13.tag_() == value_e.Undef else cast(value__Str, val13).s  # type: Optional[str]
+    self.version = cast(value__Bool, attrs['version']).b  # type: bool
+    self.xtrace_to_debug_file = cast(value__Bool, attrs['xtrace_to_debug_file']).b  # type: bool
+
+
+class mapfile(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.t = cast(value__Bool, attrs['t']).b  # type: bool
+
+
+class new_var(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.A = cast(value__Bool, attrs['A']).b  # type: bool
+    self.F = cast(value__Bool, attrs['F']).b  # type: bool
+    self.a = cast(value__Bool, attrs['a']).b  # type: bool
+    self.f = cast(value__Bool, attrs['f']).b  # type: bool
+    self.g = cast(value__Bool, attrs['g']).b  # type: bool
+    self.i = cast(value__Bool, attrs['i']).b  # type: bool
+    val6 = attrs['n']
+    self.n = None if val6.tag_() == value_e.Undef else cast(value__Str, val6).s  # type: Optional[str]
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+    val8 = attrs['r']
+    self.r = None if val8.tag_() == value_e.Undef else cast(value__Str, val8).s  # type: Optional[str]
+    val9 = attrs['x']
+    self.x = None if val9.tag_() == value_e.Undef else cast(value__Str, val9).s  # type: Optional[str]
+
+
+class printf(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    val0 = attrs['v']
+    self.v = None if val0.tag_() == value_e.Undef else cast(value__Str, val0).s  # type: Optional[str]
+
+
+class pwd(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.L = cast(value__Bool, attrs['L']).b  # type: bool
+    self.P = cast(value__Bool, attrs['P']).b  # type: bool
+
+
+class read(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.Z = cast(value__Bool, attrs['Z']).b  # type: bool
+    val1 = attrs['a']
+    self.a = None if val1.tag_() == value_e.Undef else cast(value__Str, val1).s  # type: Optional[str]
+    self.all = cast(value__Bool, attrs['all']).b  # type: bool
+    val3 = attrs['d']
+    self.d = None if val3.tag_() == value_e.Undef else cast(value__Str, val3).s  # type: Optional[str]
+    self.line = cast(value__Bool, attrs['line']).b  # type: bool
+    val5 = attrs['n']
+    self.n = -1 if val5.tag_() == value_e.Undef else cast(value__Int, val5).i  # type: int
+    val6 = attrs['p']
+    self.p = None if val6.tag_() == value_e.Undef else cast(value__Str, val6).s  # type: Optional[str]
+    self.q = cast(value__Bool, attrs['q']).b  # type: bool
+    self.r = cast(value__Bool, attrs['r']).b  # type: bool
+    self.s = cast(value__Bool, attrs['s']).b  # type: bool
+    val10 = attrs['t']
+    self.t = -1.0 if val10.tag_() == value_e.Undef else cast(value__Float, val10).f  # type: float
+    val11 = attrs['u']
+    self.u = -1 if val11.tag_() == value_e.Undef else cast(value__Int, val11).i  # type: int
+    self.with_eol = cast(value__Bool, attrs['with_eol']).b  # type: bool
+
+
+class readonly(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.A = cast(value__Bool, attrs['A']).b  # type: bool
+    self.a = cast(value__Bool, attrs['a']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+
+
+class runproc(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.h = cast(value__Bool, attrs['h']).b  # type: bool
+
+
+class shopt(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.o = cast(value__Bool, attrs['o']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+    self.q = cast(value__Bool, attrs['q']).b  # type: bool
+    self.s = cast(value__Bool, attrs['s']).b  # type: bool
+    self.u = cast(value__Bool, attrs['u']).b  # type: bool
+
+
+class tea_main(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    val0 = attrs['c']
+    self.c = None if val0.tag_() == value_e.Undef else cast(value__Str, val0).s  # type: Optional[str]
+    self.n = cast(value__Bool, attrs['n']).b  # type: bool
+    self.translate = cast(value__Bool, attrs['translate']).b  # type: bool
+
+
+class trap(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.l = cast(value__Bool, attrs['l']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+
+
+class try_(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    val0 = attrs['assign']
+    self.assign = None if val0.tag_() == value_e.Undef else cast(value__Str, val0).s  # type: Optional[str]
+
+
+class type(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.P = cast(value__Bool, attrs['P']).b  # type: bool
+    self.f = cast(value__Bool, attrs['f']).b  # type: bool
+    self.p = cast(value__Bool, attrs['p']).b  # type: bool
+    self.t = cast(value__Bool, attrs['t']).b  # type: bool
+
+
+class unset(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.f = cast(value__Bool, attrs['f']).b  # type: bool
+    self.v = cast(value__Bool, attrs['v']).b  # type: bool
+
+
+class wait(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    self.n = cast(value__Bool, attrs['n']).b  # type: bool
+
+
+class write(object):
+  def __init__(self, attrs):
+    # type: (Dict[str, value_t]) -> None
+
+    val0 = attrs['end']
+    self.end = None if val0.tag_() == value_e.Undef else cast(value__Str, val0).s  # type: Optional[str]
+    self.n = cast(value__Bool, attrs['n']).b  # type: bool
+    self.qsn = cast(value__Bool, attrs['qsn']).b  # type: bool
+    val3 = attrs['sep']
+    self.sep = None if val3.tag_() == value_e.Undef else cast(value__Str, val3).s  # type: Optional[str]
+    val4 = attrs['unicode']
+    self.unicode = None if val4.tag_() == value_e.Undef else cast(value__Str, val4).s  # type: Optional[str]
+
@@ -0,0 +1,222 @@
+from asdl import pybase
+from pylib.collections_ import OrderedDict
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, field
+
+class value_e(object):
+  Str = 1
+  Array = 2
+
+_value_str = {
+  1: 'value.Str',
+  2: 'value.Array',
+}
+
+def value_str(tag):
+  # type: (int) -> str
+  return _value_str[tag]
+
+class value_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class value__Str(value_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('value.Str')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('value.Str')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class value__Array(value_t):
+  _type_tag = 2
+  __slots__ = ('a',)
+
+  def __init__(self, a):
+    # type: (int) -> None
+    self.a = a
+
+  @staticmethod
+  def Create():
+    # type: () -> value__Array
+    return value__Array(-1)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('value.Array')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('value.Array')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class value(object):
+  Str = value__Str
+  Array = value__Array
+
+class t2(pybase.CompoundObj):
+  _type_tag = 64
+  __slots__ = ('a', 'b')
+
+  def __init__(self, a, b):
+    # type: (int, int) -> None
+    self.a = a
+    self.b = b
+
+  @staticmethod
+  def Create():
+    # type: () -> t2
+    return t2(-1, -1)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('t2')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('t2')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class t3(pybase.CompoundObj):
+  _type_tag = 65
+  __slots__ = ('a', 'b')
+
+  def __init__(self, a, b):
+    # type: (int, int) -> None
+    self.a = a
+    self.b = b
+
+  @staticmethod
+  def Create():
+    # type: () -> t3
+    return t3(-1, -1)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('t3')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('t3')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class t4(pybase.CompoundObj):
+  _type_tag = 66
+  __slots__ = ('a', 'b')
+
+  def __init__(self, a, b):
+    # type: (int, int) -> None
+    self.a = a
+    self.b = b
+
+  @staticmethod
+  def Create():
+    # type: () -> t4
+    return t4(-1, -1)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('t4')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('t4')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.a), color_e.OtherConst)
+    L.append(field('a', x0))
+
+    x1 = hnode.Leaf(str(self.b), color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
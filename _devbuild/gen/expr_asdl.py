@@ -0,0 +1,187 @@
+from asdl import pybase
+from pylib.collections_ import OrderedDict
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, field
+
+class tok_t(pybase.SimpleObj):
+  pass
+
+class tok_e(object):
+  Const = tok_t(1)
+  Var = tok_t(2)
+  Op1 = tok_t(3)
+  Op2 = tok_t(4)
+  Paren = tok_t(5)
+  Eof = tok_t(6)
+  Invalid = tok_t(7)
+
+_tok_str = {
+  1: 'tok.Const',
+  2: 'tok.Var',
+  3: 'tok.Op1',
+  4: 'tok.Op2',
+  5: 'tok.Paren',
+  6: 'tok.Eof',
+  7: 'tok.Invalid',
+}
+
+def tok_str(val):
+  # type: (tok_t) -> str
+  return _tok_str[val]
+
+class expr_e(object):
+  Const = 1
+  Var = 2
+  Binary = 3
+
+_expr_str = {
+  1: 'expr.Const',
+  2: 'expr.Var',
+  3: 'expr.Binary',
+}
+
+def expr_str(tag):
+  # type: (int) -> str
+  return _expr_str[tag]
+
+class expr_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class expr__Const(expr_t):
+  _type_tag = 1
+  __slots__ = ('i',)
+
+  def __init__(self, i):
+    # type: (int) -> None
+    self.i = i
+
+  @staticmethod
+  def Create():
+    # type: () -> expr__Const
+    return expr__Const(-1)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Const')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+    L.append(field('i', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Const')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+    L.append(field('i', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__Var(expr_t):
+  _type_tag = 2
+  __slots__ = ('name',)
+
+  def __init__(self, name):
+    # type: (str) -> None
+    self.name = name
+
+  @staticmethod
+  def Create():
+    # type: () -> expr__Var
+    return expr__Var('')
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Var')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Var')
+    L = out_node.fields
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr__Binary(expr_t):
+  _type_tag = 3
+  __slots__ = ('op', 'left', 'right')
+
+  def __init__(self, op, left, right):
+    # type: (str, Optional[expr_t], Optional[expr_t]) -> None
+    self.op = op
+    self.left = left
+    self.right = right
+
+  @staticmethod
+  def Create():
+    # type: () -> expr__Binary
+    return expr__Binary('', None, None)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Binary')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.op, color_e.StringConst)
+    L.append(field('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.PrettyTree()
+    L.append(field('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.PrettyTree()
+    L.append(field('right', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Binary')
+    L = out_node.fields
+    x0 = NewLeaf(self.op, color_e.StringConst)
+    L.append(field('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.AbbreviatedTree()
+    L.append(field('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.AbbreviatedTree()
+    L.append(field('right', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr(object):
+  Const = expr__Const
+  Var = expr__Var
+  Binary = expr__Binary
+
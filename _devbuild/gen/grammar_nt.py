@@ -0,0 +1,90 @@
+# This code is generated by pgen2/grammar.py
+
+augassign = 256
+and_expr = 257
+and_test = 258
+arglist = 259
+argument = 260
+arith_expr = 261
+array_item = 262
+atom = 263
+braced_var_sub = 264
+char_literal = 265
+class_item = 266
+class_items = 267
+class_literal = 268
+class_literal_term = 269
+comma_newline = 270
+command_expr = 271
+comp_for = 272
+comp_op = 273
+comparison = 274
+data_params = 275
+dict = 276
+dict_pair = 277
+dq_string = 278
+end_import = 279
+end_outer = 280
+end_stmt = 281
+expr = 282
+factor = 283
+func_item = 284
+func_items = 285
+func_param = 286
+func_params = 287
+import_name = 288
+import_names = 289
+lambdef = 290
+module_item = 291
+name_type = 292
+name_type_list = 293
+named_func = 294
+not_test = 295
+oil_arglist = 296
+oil_expr = 297
+oil_expr_sub = 298
+oil_for = 299
+oil_place_mutation = 300
+oil_proc = 301
+oil_var_decl = 302
+or_test = 303
+place_list = 304
+power = 305
+proc_param = 306
+proc_params = 307
+range_char = 308
+range_expr = 309
+re_alt = 310
+re_atom = 311
+re_flag = 312
+re_flags = 313
+regex = 314
+repeat_op = 315
+repeat_range = 316
+semi_newline = 317
+sh_array_literal = 318
+sh_command_sub = 319
+shift_expr = 320
+simple_var_sub = 321
+splat_expr = 322
+sq_string = 323
+subscript = 324
+subscriptlist = 325
+suite = 326
+tea_class = 327
+tea_data = 328
+tea_enum = 329
+tea_func = 330
+tea_import = 331
+tea_module = 332
+tea_word = 333
+term = 334
+test = 335
+testlist = 336
+testlist_comp = 337
+trailer = 338
+type_expr = 339
+type_expr_list = 340
+variant = 341
+variant_type = 342
+xor_expr = 343
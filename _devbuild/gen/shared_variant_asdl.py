@@ -0,0 +1,531 @@
+from asdl import pybase
+from pylib.collections_ import OrderedDict
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, field
+
+class expr_e(object):
+  Binary = 1
+  DoubleQuoted = 65
+
+_expr_str = {
+  1: 'expr.Binary',
+  65: 'expr.DoubleQuoted',
+}
+
+def expr_str(tag):
+  # type: (int) -> str
+  return _expr_str[tag]
+
+class expr_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class expr__Binary(expr_t):
+  _type_tag = 1
+  __slots__ = ('left', 'right', 'spids')
+
+  def __init__(self, left, right, spids=None):
+    # type: (Optional[expr_t], Optional[expr_t], Optional[List[int]]) -> None
+    self.left = left
+    self.right = right
+    self.spids = spids if spids is not None else []
+
+  @staticmethod
+  def Create():
+    # type: () -> expr__Binary
+    return expr__Binary(None, None, [])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Binary')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree()
+    L.append(field('left', x0))
+
+    assert self.right is not None
+    x1 = self.right.PrettyTree()
+    L.append(field('right', x1))
+
+    if self.spids is not None:  # array
+      x2 = hnode.Array([])
+      for i2 in self.spids:
+        x2.children.append(hnode.Leaf(str(i2), color_e.OtherConst))
+      L.append(field('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('expr.Binary')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree()
+    L.append(field('left', x0))
+
+    assert self.right is not None
+    x1 = self.right.AbbreviatedTree()
+    L.append(field('right', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class expr(object):
+  Binary = expr__Binary
+
+class tok_e(object):
+  Eof = 1
+  Token = 66
+
+_tok_str = {
+  1: 'tok.Eof',
+  66: 'tok.Token',
+}
+
+def tok_str(tag):
+  # type: (int) -> str
+  return _tok_str[tag]
+
+class tok_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class tok__Eof(tok_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('tok.Eof')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('tok.Eof')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class tok(object):
+  Eof = tok__Eof
+
+class word_part_e(object):
+  Literal = 1
+  DoubleQuoted = 65
+
+_word_part_str = {
+  1: 'word_part.Literal',
+  65: 'word_part.DoubleQuoted',
+}
+
+def word_part_str(tag):
+  # type: (int) -> str
+  return _word_part_str[tag]
+
+class word_part_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class word_part__Literal(word_part_t):
+  _type_tag = 1
+  __slots__ = ('s',)
+
+  def __init__(self, s):
+    # type: (str) -> None
+    self.s = s
+
+  @staticmethod
+  def Create():
+    # type: () -> word_part__Literal
+    return word_part__Literal('')
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('word_part.Literal')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.s, color_e.StringConst)
+    L.append(field('s', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('word_part.Literal')
+    L = out_node.fields
+    x0 = NewLeaf(self.s, color_e.StringConst)
+    L.append(field('s', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class word_part(object):
+  Literal = word_part__Literal
+
+class cflow_e(object):
+  Break = 1
+  Continue = 2
+  Return = 3
+
+_cflow_str = {
+  1: 'cflow.Break',
+  2: 'cflow.Continue',
+  3: 'cflow.Return',
+}
+
+def cflow_str(tag):
+  # type: (int) -> str
+  return _cflow_str[tag]
+
+class cflow_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class cflow__Break(cflow_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Break')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Break')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow__Continue(cflow_t):
+  _type_tag = 2
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Continue')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Continue')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow__Return(cflow_t):
+  _type_tag = 3
+  __slots__ = ('val',)
+
+  def __init__(self, val):
+    # type: (int) -> None
+    self.val = val
+
+  @staticmethod
+  def Create():
+    # type: () -> cflow__Return
+    return cflow__Return(-1)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Return')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.val), color_e.OtherConst)
+    L.append(field('val', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Return')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.val), color_e.OtherConst)
+    L.append(field('val', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow(object):
+  Break = cflow__Break
+  Continue = cflow__Continue
+  Return = cflow__Return
+
+class prod_with_attrs(pybase.CompoundObj):
+  _type_tag = 64
+  __slots__ = ('a', 'b', 'spid')
+
+  def __init__(self, a, b, spid=None):
+    # type: (str, str, Optional[List[int]]) -> None
+    self.a = a
+    self.b = b
+    self.spid = spid if spid is not None else []
+
+  @staticmethod
+  def Create():
+    # type: () -> prod_with_attrs
+    return prod_with_attrs('', '', [])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('prod_with_attrs')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.a, color_e.StringConst)
+    L.append(field('a', x0))
+
+    x1 = NewLeaf(self.b, color_e.StringConst)
+    L.append(field('b', x1))
+
+    if self.spid is not None:  # array
+      x2 = hnode.Array([])
+      for i2 in self.spid:
+        x2.children.append(hnode.Leaf(str(i2), color_e.OtherConst))
+      L.append(field('spid', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('prod_with_attrs')
+    L = out_node.fields
+    x0 = NewLeaf(self.a, color_e.StringConst)
+    L.append(field('a', x0))
+
+    x1 = NewLeaf(self.b, color_e.StringConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class double_quoted(expr_t, word_part_t):
+  _type_tag = 65
+  __slots__ = ('left', 'tokens')
+
+  def __init__(self, left, tokens):
+    # type: (int, Optional[List[str]]) -> None
+    self.left = left
+    self.tokens = tokens
+
+  @staticmethod
+  def Create():
+    # type: () -> double_quoted
+    return double_quoted(-1, [])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('double_quoted')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.left), color_e.OtherConst)
+    L.append(field('left', x0))
+
+    if self.tokens is not None:  # array
+      x1 = hnode.Array([])
+      for i1 in self.tokens:
+        x1.children.append(NewLeaf(i1, color_e.StringConst))
+      L.append(field('tokens', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('double_quoted')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.left), color_e.OtherConst)
+    L.append(field('left', x0))
+
+    if self.tokens is not None:  # array
+      x1 = hnode.Array([])
+      for i1 in self.tokens:
+        x1.children.append(NewLeaf(i1, color_e.StringConst))
+      L.append(field('tokens', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class Token(tok_t):
+  _type_tag = 66
+  __slots__ = ('id', 'val')
+
+  def __init__(self, id, val):
+    # type: (int, str) -> None
+    self.id = id
+    self.val = val
+
+  @staticmethod
+  def Create():
+    # type: () -> Token
+    return Token(-1, '')
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Token')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.id), color_e.OtherConst)
+    L.append(field('id', x0))
+
+    x1 = NewLeaf(self.val, color_e.StringConst)
+    L.append(field('val', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Token')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.id), color_e.OtherConst)
+    L.append(field('id', x0))
+
+    x1 = NewLeaf(self.val, color_e.StringConst)
+    L.append(field('val', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class tok_struct(pybase.CompoundObj):
+  _type_tag = 67
+  __slots__ = ('token', 'x')
+
+  def __init__(self, token, x):
+    # type: (Optional[tok_t], int) -> None
+    self.token = token
+    self.x = x
+
+  @staticmethod
+  def Create():
+    # type: () -> tok_struct
+    return tok_struct(None, -1)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('tok_struct')
+    L = out_node.fields
+
+    assert self.token is not None
+    x0 = self.token.PrettyTree()
+    L.append(field('token', x0))
+
+    x1 = hnode.Leaf(str(self.x), color_e.OtherConst)
+    L.append(field('x', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('tok_struct')
+    L = out_node.fields
+    assert self.token is not None
+    x0 = self.token.AbbreviatedTree()
+    L.append(field('token', x0))
+
+    x1 = hnode.Leaf(str(self.x), color_e.OtherConst)
+    L.append(field('x', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class tok_array(pybase.CompoundObj):
+  _type_tag = 68
+  __slots__ = ('tokens',)
+
+  def __init__(self, tokens):
+    # type: (Optional[List[tok_t]]) -> None
+    self.tokens = tokens
+
+  @staticmethod
+  def Create():
+    # type: () -> tok_array
+    return tok_array([])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('tok_array')
+    L = out_node.fields
+
+    if self.tokens is not None:  # array
+      x0 = hnode.Array([])
+      for i0 in self.tokens:
+        x0.children.append(i0.PrettyTree())
+      L.append(field('tokens', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('tok_array')
+    L = out_node.fields
+    if self.tokens is not None:  # array
+      x0 = hnode.Array([])
+      for i0 in self.tokens:
+        x0.children.append(i0.AbbreviatedTree())
+      L.append(field('tokens', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
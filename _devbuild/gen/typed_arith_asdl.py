@@ -0,0 +1,627 @@
+from asdl import pybase
+from pylib.collections_ import OrderedDict
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, field
+
+class arith_expr_e(object):
+  NoOp = 1
+  Const = 2
+  Var = 3
+  Unary = 4
+  Binary = 5
+  Ternary = 6
+  FuncCall = 7
+  Index = 8
+  Slice = 9
+
+_arith_expr_str = {
+  1: 'arith_expr.NoOp',
+  2: 'arith_expr.Const',
+  3: 'arith_expr.Var',
+  4: 'arith_expr.Unary',
+  5: 'arith_expr.Binary',
+  6: 'arith_expr.Ternary',
+  7: 'arith_expr.FuncCall',
+  8: 'arith_expr.Index',
+  9: 'arith_expr.Slice',
+}
+
+def arith_expr_str(tag):
+  # type: (int) -> str
+  return _arith_expr_str[tag]
+
+class arith_expr_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class arith_expr__NoOp(arith_expr_t):
+  _type_tag = 1
+  __slots__ = ('spids',)
+
+  def __init__(self, spids=None):
+    # type: (Optional[List[int]]) -> None
+    self.spids = spids if spids is not None else []
+
+  @staticmethod
+  def Create():
+    # type: () -> arith_expr__NoOp
+    return arith_expr__NoOp([])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.NoOp')
+    L = out_node.fields
+
+    if self.spids is not None:  # array
+      x0 = hnode.Array([])
+      for i0 in self.spids:
+        x0.children.append(hnode.Leaf(str(i0), color_e.OtherConst))
+      L.append(field('spids', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.NoOp')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class arith_expr__Const(arith_expr_t):
+  _type_tag = 2
+  __slots__ = ('i', 'spids')
+
+  def __init__(self, i, spids=None):
+    # type: (int, Optional[List[int]]) -> None
+    self.i = i
+    self.spids = spids if spids is not None else []
+
+  @staticmethod
+  def Create():
+    # type: () -> arith_expr__Const
+    return arith_expr__Const(-1, [])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Const')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+    L.append(field('i', x0))
+
+    if self.spids is not None:  # array
+      x1 = hnode.Array([])
+      for i1 in self.spids:
+        x1.children.append(hnode.Leaf(str(i1), color_e.OtherConst))
+      L.append(field('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Const')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.i), color_e.OtherConst)
+    L.append(field('i', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    p = _arith_expr__Const(self)
+    return p if p else self._AbbreviatedTree()
+
+class arith_expr__Var(arith_expr_t):
+  _type_tag = 3
+  __slots__ = ('name', 'spids')
+
+  def __init__(self, name, spids=None):
+    # type: (str, Optional[List[int]]) -> None
+    self.name = name
+    self.spids = spids if spids is not None else []
+
+  @staticmethod
+  def Create():
+    # type: () -> arith_expr__Var
+    return arith_expr__Var('', [])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Var')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    if self.spids is not None:  # array
+      x1 = hnode.Array([])
+      for i1 in self.spids:
+        x1.children.append(hnode.Leaf(str(i1), color_e.OtherConst))
+      L.append(field('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Var')
+    L = out_node.fields
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    p = _arith_expr__Var(self)
+    return p if p else self._AbbreviatedTree()
+
+class arith_expr__Unary(arith_expr_t):
+  _type_tag = 4
+  __slots__ = ('op', 'a', 'spids')
+
+  def __init__(self, op, a, spids=None):
+    # type: (str, Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.op = op
+    self.a = a
+    self.spids = spids if spids is not None else []
+
+  @staticmethod
+  def Create():
+    # type: () -> arith_expr__Unary
+    return arith_expr__Unary('', None, [])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Unary')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.op, color_e.StringConst)
+    L.append(field('op', x0))
+
+    assert self.a is not None
+    x1 = self.a.PrettyTree()
+    L.append(field('a', x1))
+
+    if self.spids is not None:  # array
+      x2 = hnode.Array([])
+      for i2 in self.spids:
+        x2.children.append(hnode.Leaf(str(i2), color_e.OtherConst))
+      L.append(field('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Unary')
+    L = out_node.fields
+    x0 = NewLeaf(self.op, color_e.StringConst)
+    L.append(field('op', x0))
+
+    assert self.a is not None
+    x1 = self.a.AbbreviatedTree()
+    L.append(field('a', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    p = _arith_expr__Unary(self)
+    return p if p else self._AbbreviatedTree()
+
+class arith_expr__Binary(arith_expr_t):
+  _type_tag = 5
+  __slots__ = ('op', 'left', 'right', 'spids')
+
+  def __init__(self, op, left, right, spids=None):
+    # type: (str, Optional[arith_expr_t], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.op = op
+    self.left = left
+    self.right = right
+    self.spids = spids if spids is not None else []
+
+  @staticmethod
+  def Create():
+    # type: () -> arith_expr__Binary
+    return arith_expr__Binary('', None, None, [])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Binary')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.op, color_e.StringConst)
+    L.append(field('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.PrettyTree()
+    L.append(field('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.PrettyTree()
+    L.append(field('right', x2))
+
+    if self.spids is not None:  # array
+      x3 = hnode.Array([])
+      for i3 in self.spids:
+        x3.children.append(hnode.Leaf(str(i3), color_e.OtherConst))
+      L.append(field('spids', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Binary')
+    L = out_node.fields
+    x0 = NewLeaf(self.op, color_e.StringConst)
+    L.append(field('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.AbbreviatedTree()
+    L.append(field('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.AbbreviatedTree()
+    L.append(field('right', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    p = _arith_expr__Binary(self)
+    return p if p else self._AbbreviatedTree()
+
+class arith_expr__Ternary(arith_expr_t):
+  _type_tag = 6
+  __slots__ = ('cond', 'true_expr', 'false_expr', 'spids')
+
+  def __init__(self, cond, true_expr, false_expr, spids=None):
+    # type: (Optional[arith_expr_t], Optional[arith_expr_t], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.cond = cond
+    self.true_expr = true_expr
+    self.false_expr = false_expr
+    self.spids = spids if spids is not None else []
+
+  @staticmethod
+  def Create():
+    # type: () -> arith_expr__Ternary
+    return arith_expr__Ternary(None, None, None, [])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Ternary')
+    L = out_node.fields
+
+    assert self.cond is not None
+    x0 = self.cond.PrettyTree()
+    L.append(field('cond', x0))
+
+    assert self.true_expr is not None
+    x1 = self.true_expr.PrettyTree()
+    L.append(field('true_expr', x1))
+
+    assert self.false_expr is not None
+    x2 = self.false_expr.PrettyTree()
+    L.append(field('false_expr', x2))
+
+    if self.spids is not None:  # array
+      x3 = hnode.Array([])
+      for i3 in self.spids:
+        x3.children.append(hnode.Leaf(str(i3), color_e.OtherConst))
+      L.append(field('spids', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Ternary')
+    L = out_node.fields
+    assert self.cond is not None
+    x0 = self.cond.AbbreviatedTree()
+    L.append(field('cond', x0))
+
+    assert self.true_expr is not None
+    x1 = self.true_expr.AbbreviatedTree()
+    L.append(field('true_expr', x1))
+
+    assert self.false_expr is not None
+    x2 = self.false_expr.AbbreviatedTree()
+    L.append(field('false_expr', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class arith_expr__FuncCall(arith_expr_t):
+  _type_tag = 7
+  __slots__ = ('name', 'args', 'spids')
+
+  def __init__(self, name, args, spids=None):
+    # type: (str, Optional[List[arith_expr_t]], Optional[List[int]]) -> None
+    self.name = name
+    self.args = args
+    self.spids = spids if spids is not None else []
+
+  @staticmethod
+  def Create():
+    # type: () -> arith_expr__FuncCall
+    return arith_expr__FuncCall('', [], [])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.FuncCall')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    if self.args is not None:  # array
+      x1 = hnode.Array([])
+      for i1 in self.args:
+        x1.children.append(i1.PrettyTree())
+      L.append(field('args', x1))
+
+    if self.spids is not None:  # array
+      x2 = hnode.Array([])
+      for i2 in self.spids:
+        x2.children.append(hnode.Leaf(str(i2), color_e.OtherConst))
+      L.append(field('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.FuncCall')
+    L = out_node.fields
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    if self.args is not None:  # array
+      x1 = hnode.Array([])
+      for i1 in self.args:
+        x1.children.append(i1.AbbreviatedTree())
+      L.append(field('args', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class arith_expr__Index(arith_expr_t):
+  _type_tag = 8
+  __slots__ = ('a', 'index', 'spids')
+
+  def __init__(self, a, index, spids=None):
+    # type: (Optional[arith_expr_t], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.a = a
+    self.index = index
+    self.spids = spids if spids is not None else []
+
+  @staticmethod
+  def Create():
+    # type: () -> arith_expr__Index
+    return arith_expr__Index(None, None, [])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Index')
+    L = out_node.fields
+
+    assert self.a is not None
+    x0 = self.a.PrettyTree()
+    L.append(field('a', x0))
+
+    assert self.index is not None
+    x1 = self.index.PrettyTree()
+    L.append(field('index', x1))
+
+    if self.spids is not None:  # array
+      x2 = hnode.Array([])
+      for i2 in self.spids:
+        x2.children.append(hnode.Leaf(str(i2), color_e.OtherConst))
+      L.append(field('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Index')
+    L = out_node.fields
+    assert self.a is not None
+    x0 = self.a.AbbreviatedTree()
+    L.append(field('a', x0))
+
+    assert self.index is not None
+    x1 = self.index.AbbreviatedTree()
+    L.append(field('index', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class arith_expr__Slice(arith_expr_t):
+  _type_tag = 9
+  __slots__ = ('a', 'begin', 'end', 'stride', 'spids')
+
+  def __init__(self, a, begin, end, stride, spids=None):
+    # type: (Optional[arith_expr_t], Optional[Optional[arith_expr_t]], Optional[Optional[arith_expr_t]], Optional[Optional[arith_expr_t]], Optional[List[int]]) -> None
+    self.a = a
+    self.begin = begin
+    self.end = end
+    self.stride = stride
+    self.spids = spids if spids is not None else []
+
+  @staticmethod
+  def Create():
+    # type: () -> arith_expr__Slice
+    return arith_expr__Slice(None, None, None, None, [])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Slice')
+    L = out_node.fields
+
+    assert self.a is not None
+    x0 = self.a.PrettyTree()
+    L.append(field('a', x0))
+
+    if self.begin is not None:  # maybe
+      x1 = self.begin.PrettyTree()
+      L.append(field('begin', x1))
+
+    if self.end is not None:  # maybe
+      x2 = self.end.PrettyTree()
+      L.append(field('end', x2))
+
+    if self.stride is not None:  # maybe
+      x3 = self.stride.PrettyTree()
+      L.append(field('stride', x3))
+
+    if self.spids is not None:  # array
+      x4 = hnode.Array([])
+      for i4 in self.spids:
+        x4.children.append(hnode.Leaf(str(i4), color_e.OtherConst))
+      L.append(field('spids', x4))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('arith_expr.Slice')
+    L = out_node.fields
+    assert self.a is not None
+    x0 = self.a.AbbreviatedTree()
+    L.append(field('a', x0))
+
+    if self.begin is not None:  # maybe
+      x1 = self.begin.AbbreviatedTree()
+      L.append(field('begin', x1))
+
+    if self.end is not None:  # maybe
+      x2 = self.end.AbbreviatedTree()
+      L.append(field('end', x2))
+
+    if self.stride is not None:  # maybe
+      x3 = self.stride.AbbreviatedTree()
+      L.append(field('stride', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class arith_expr(object):
+  NoOp = arith_expr__NoOp
+  Const = arith_expr__Const
+  Var = arith_expr__Var
+  Unary = arith_expr__Unary
+  Binary = arith_expr__Binary
+  Ternary = arith_expr__Ternary
+  FuncCall = arith_expr__FuncCall
+  Index = arith_expr__Index
+  Slice = arith_expr__Slice
+
+class pipeline(pybase.CompoundObj):
+  _type_tag = 64
+  __slots__ = ('negated',)
+
+  def __init__(self, negated):
+    # type: (bool) -> None
+    self.negated = negated
+
+  @staticmethod
+  def Create():
+    # type: () -> pipeline
+    return pipeline(False)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('pipeline')
+    L = out_node.fields
+
+    x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+    L.append(field('negated', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('pipeline')
+    L = out_node.fields
+    x0 = hnode.Leaf('T' if self.negated else 'F', color_e.OtherConst)
+    L.append(field('negated', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+#
+# CONCATENATED FILE
+#
+
+"""
+typed_arith_abbrev.py - Abbreviations for pretty-printing typed_arith.asdl.
+"""
+
+from asdl import runtime
+from _devbuild.gen.hnode_asdl import hnode__Record
+
+def _arith_expr__Unary(obj):
+  # type: (arith_expr__Unary) -> hnode__Record
+
+  p_node = runtime.NewRecord('U')
+  p_node.abbrev = True
+  n = runtime.NewLeaf(str(obj.op), color_e.StringConst)
+  p_node.unnamed_fields.append(n)
+  p_node.unnamed_fields.append(obj.a.AbbreviatedTree())  # type: ignore
+  return p_node
+
+
+def _arith_expr__Binary(obj):
+  # type: (arith_expr__Binary) -> Optional[hnode__Record]
+
+  if obj.op == '=':  # test for fallback
+    return None
+
+  p_node = runtime.NewRecord('B')
+  p_node.abbrev = True
+  n = runtime.NewLeaf(str(obj.op), color_e.StringConst)
+  p_node.unnamed_fields.append(n)
+  p_node.unnamed_fields.append(obj.left.AbbreviatedTree())  # type: ignore
+  p_node.unnamed_fields.append(obj.right.AbbreviatedTree())  # type: ignore
+  return p_node
+
+
+def _arith_expr__Const(obj):
+  # type: (arith_expr__Const) -> hnode__Record
+  p_node = runtime.NewRecord('')
+  p_node.abbrev = True
+  n = runtime.NewLeaf(str(obj.i), color_e.OtherConst)
+  p_node.unnamed_fields.append(n)
+  return p_node
+
+
+def _arith_expr__Var(obj):
+  # type: (arith_expr__Var) -> hnode__Record
+  p_node = runtime.NewRecord('$')
+  p_node.abbrev = True
+  n = runtime.NewLeaf(str(obj.name), color_e.StringConst)
+  p_node.unnamed_fields.append(n)
+  return p_node
+
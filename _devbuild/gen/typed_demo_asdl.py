@@ -0,0 +1,1085 @@
+from asdl import pybase
+from pylib.collections_ import OrderedDict
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from _devbuild.gen.demo_lib_asdl import value_t
+
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, field
+
+class op_id_t(pybase.SimpleObj):
+  pass
+
+class op_id_e(object):
+  Plus = op_id_t(1)
+  Minus = op_id_t(2)
+  Star = op_id_t(3)
+
+_op_id_str = {
+  1: 'op_id.Plus',
+  2: 'op_id.Minus',
+  3: 'op_id.Star',
+}
+
+def op_id_str(val):
+  # type: (op_id_t) -> str
+  return _op_id_str[val]
+
+class cflow_e(object):
+  Break = 1
+  Continue = 2
+  Return = 3
+
+_cflow_str = {
+  1: 'cflow.Break',
+  2: 'cflow.Continue',
+  3: 'cflow.Return',
+}
+
+def cflow_str(tag):
+  # type: (int) -> str
+  return _cflow_str[tag]
+
+class cflow_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class cflow__Break(cflow_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Break')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Break')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow__Continue(cflow_t):
+  _type_tag = 2
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Continue')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Continue')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow__Return(cflow_t):
+  _type_tag = 3
+  __slots__ = ('status',)
+
+  def __init__(self, status):
+    # type: (int) -> None
+    self.status = status
+
+  @staticmethod
+  def Create():
+    # type: () -> cflow__Return
+    return cflow__Return(-1)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Return')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.status), color_e.OtherConst)
+    L.append(field('status', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow.Return')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.status), color_e.OtherConst)
+    L.append(field('status', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow(object):
+  Break = cflow__Break
+  Continue = cflow__Continue
+  Return = cflow__Return
+
+class bool_expr_e(object):
+  Binary = 1
+  Unary = 2
+  LogicalNot = 3
+  LogicalBinary = 4
+
+_bool_expr_str = {
+  1: 'bool_expr.Binary',
+  2: 'bool_expr.Unary',
+  3: 'bool_expr.LogicalNot',
+  4: 'bool_expr.LogicalBinary',
+}
+
+def bool_expr_str(tag):
+  # type: (int) -> str
+  return _bool_expr_str[tag]
+
+class bool_expr_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class bool_expr__Binary(bool_expr_t):
+  _type_tag = 1
+  __slots__ = ('left', 'right')
+
+  def __init__(self, left, right):
+    # type: (Optional[word], Optional[word]) -> None
+    self.left = left
+    self.right = right
+
+  @staticmethod
+  def Create():
+    # type: () -> bool_expr__Binary
+    return bool_expr__Binary(None, None)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.Binary')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree()
+    L.append(field('left', x0))
+
+    assert self.right is not None
+    x1 = self.right.PrettyTree()
+    L.append(field('right', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.Binary')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree()
+    L.append(field('left', x0))
+
+    assert self.right is not None
+    x1 = self.right.AbbreviatedTree()
+    L.append(field('right', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class bool_expr__Unary(bool_expr_t):
+  _type_tag = 2
+  __slots__ = ('child',)
+
+  def __init__(self, child):
+    # type: (Optional[word]) -> None
+    self.child = child
+
+  @staticmethod
+  def Create():
+    # type: () -> bool_expr__Unary
+    return bool_expr__Unary(None)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.Unary')
+    L = out_node.fields
+
+    assert self.child is not None
+    x0 = self.child.PrettyTree()
+    L.append(field('child', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.Unary')
+    L = out_node.fields
+    assert self.child is not None
+    x0 = self.child.AbbreviatedTree()
+    L.append(field('child', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class bool_expr__LogicalNot(bool_expr_t):
+  _type_tag = 3
+  __slots__ = ('b',)
+
+  def __init__(self, b):
+    # type: (Optional[bool_expr_t]) -> None
+    self.b = b
+
+  @staticmethod
+  def Create():
+    # type: () -> bool_expr__LogicalNot
+    return bool_expr__LogicalNot(None)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.LogicalNot')
+    L = out_node.fields
+
+    assert self.b is not None
+    x0 = self.b.PrettyTree()
+    L.append(field('b', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.LogicalNot')
+    L = out_node.fields
+    assert self.b is not None
+    x0 = self.b.AbbreviatedTree()
+    L.append(field('b', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class bool_expr__LogicalBinary(bool_expr_t):
+  _type_tag = 4
+  __slots__ = ('op', 'left', 'right')
+
+  def __init__(self, op, left, right):
+    # type: (op_id_t, Optional[bool_expr_t], Optional[bool_expr_t]) -> None
+    self.op = op
+    self.left = left
+    self.right = right
+
+  @staticmethod
+  def Create():
+    # type: () -> bool_expr__LogicalBinary
+    return bool_expr__LogicalBinary(op_id_e.Plus, None, None)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.LogicalBinary')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(op_id_str(self.op), color_e.TypeName)
+    L.append(field('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.PrettyTree()
+    L.append(field('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.PrettyTree()
+    L.append(field('right', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('bool_expr.LogicalBinary')
+    L = out_node.fields
+    x0 = hnode.Leaf(op_id_str(self.op), color_e.TypeName)
+    L.append(field('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.AbbreviatedTree()
+    L.append(field('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.AbbreviatedTree()
+    L.append(field('right', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class bool_expr(object):
+  Binary = bool_expr__Binary
+  Unary = bool_expr__Unary
+  LogicalNot = bool_expr__LogicalNot
+  LogicalBinary = bool_expr__LogicalBinary
+
+class cflow2_e(object):
+  Break = 1
+  Continue = 2
+  Return = 3
+
+_cflow2_str = {
+  1: 'cflow2.Break',
+  2: 'cflow2.Continue',
+  3: 'cflow2.Return',
+}
+
+def cflow2_str(tag):
+  # type: (int) -> str
+  return _cflow2_str[tag]
+
+class cflow2_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class cflow2__Break(cflow2_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow2.Break')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow2.Break')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow2__Continue(cflow2_t):
+  _type_tag = 2
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow2.Continue')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow2.Continue')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow2__Return(cflow2_t):
+  _type_tag = 3
+  __slots__ = ('status',)
+
+  def __init__(self, status):
+    # type: (int) -> None
+    self.status = status
+
+  @staticmethod
+  def Create():
+    # type: () -> cflow2__Return
+    return cflow2__Return(-1)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow2.Return')
+    L = out_node.fields
+
+    x0 = hnode.Leaf(str(self.status), color_e.OtherConst)
+    L.append(field('status', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('cflow2.Return')
+    L = out_node.fields
+    x0 = hnode.Leaf(str(self.status), color_e.OtherConst)
+    L.append(field('status', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class cflow2(object):
+  Break = cflow2__Break
+  Continue = cflow2__Continue
+  Return = cflow2__Return
+
+class flag_type_e(object):
+  Bool = 1
+  Int = 2
+  Float = 3
+  Str = 4
+  Enum = 5
+
+_flag_type_str = {
+  1: 'flag_type.Bool',
+  2: 'flag_type.Int',
+  3: 'flag_type.Float',
+  4: 'flag_type.Str',
+  5: 'flag_type.Enum',
+}
+
+def flag_type_str(tag):
+  # type: (int) -> str
+  return _flag_type_str[tag]
+
+class flag_type_t(pybase.CompoundObj):
+  def tag_(self):
+    # type: () -> int
+    return self._type_tag
+  pass
+
+class flag_type__Bool(flag_type_t):
+  _type_tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('flag_type.Bool')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('flag_type.Bool')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class flag_type__Int(flag_type_t):
+  _type_tag = 2
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('flag_type.Int')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('flag_type.Int')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class flag_type__Float(flag_type_t):
+  _type_tag = 3
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('flag_type.Float')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('flag_type.Float')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class flag_type__Str(flag_type_t):
+  _type_tag = 4
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('flag_type.Str')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('flag_type.Str')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class flag_type__Enum(flag_type_t):
+  _type_tag = 5
+  __slots__ = ('alts',)
+
+  def __init__(self, alts):
+    # type: (Optional[List[str]]) -> None
+    self.alts = alts
+
+  @staticmethod
+  def Create():
+    # type: () -> flag_type__Enum
+    return flag_type__Enum([])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('flag_type.Enum')
+    L = out_node.fields
+
+    if self.alts is not None:  # array
+      x0 = hnode.Array([])
+      for i0 in self.alts:
+        x0.children.append(NewLeaf(i0, color_e.StringConst))
+      L.append(field('alts', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('flag_type.Enum')
+    L = out_node.fields
+    if self.alts is not None:  # array
+      x0 = hnode.Array([])
+      for i0 in self.alts:
+        x0.children.append(NewLeaf(i0, color_e.StringConst))
+      L.append(field('alts', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class flag_type(object):
+  Bool = flag_type__Bool
+  Int = flag_type__Int
+  Float = flag_type__Float
+  Str = flag_type__Str
+  Enum = flag_type__Enum
+
+class op_array(pybase.CompoundObj):
+  _type_tag = 64
+  __slots__ = ('ops',)
+
+  def __init__(self, ops):
+    # type: (Optional[List[op_id_t]]) -> None
+    self.ops = ops
+
+  @staticmethod
+  def Create():
+    # type: () -> op_array
+    return op_array([])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('op_array')
+    L = out_node.fields
+
+    if self.ops is not None:  # array
+      x0 = hnode.Array([])
+      for i0 in self.ops:
+        x0.children.append(hnode.Leaf(op_id_str(i0), color_e.TypeName))
+      L.append(field('ops', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('op_array')
+    L = out_node.fields
+    if self.ops is not None:  # array
+      x0 = hnode.Array([])
+      for i0 in self.ops:
+        x0.children.append(hnode.Leaf(op_id_str(i0), color_e.TypeName))
+      L.append(field('ops', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class assign(pybase.CompoundObj):
+  _type_tag = 65
+  __slots__ = ('name', 'flags')
+
+  def __init__(self, name, flags):
+    # type: (str, Optional[List[str]]) -> None
+    self.name = name
+    self.flags = flags
+
+  @staticmethod
+  def Create():
+    # type: () -> assign
+    return assign('', [])
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('assign')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    if self.flags is not None:  # array
+      x1 = hnode.Array([])
+      for i1 in self.flags:
+        x1.children.append(NewLeaf(i1, color_e.StringConst))
+      L.append(field('flags', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('assign')
+    L = out_node.fields
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    if self.flags is not None:  # array
+      x1 = hnode.Array([])
+      for i1 in self.flags:
+        x1.children.append(NewLeaf(i1, color_e.StringConst))
+      L.append(field('flags', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class source_location(pybase.CompoundObj):
+  _type_tag = 66
+  __slots__ = ('path', 'line', 'col', 'length')
+
+  def __init__(self, path, line, col, length):
+    # type: (str, int, int, int) -> None
+    self.path = path
+    self.line = line
+    self.col = col
+    self.length = length
+
+  @staticmethod
+  def Create():
+    # type: () -> source_location
+    return source_location('', -1, -1, -1)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('source_location')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.path, color_e.StringConst)
+    L.append(field('path', x0))
+
+    x1 = hnode.Leaf(str(self.line), color_e.OtherConst)
+    L.append(field('line', x1))
+
+    x2 = hnode.Leaf(str(self.col), color_e.OtherConst)
+    L.append(field('col', x2))
+
+    x3 = hnode.Leaf(str(self.length), color_e.OtherConst)
+    L.append(field('length', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('source_location')
+    L = out_node.fields
+    x0 = NewLeaf(self.path, color_e.StringConst)
+    L.append(field('path', x0))
+
+    x1 = hnode.Leaf(str(self.line), color_e.OtherConst)
+    L.append(field('line', x1))
+
+    x2 = hnode.Leaf(str(self.col), color_e.OtherConst)
+    L.append(field('col', x2))
+
+    x3 = hnode.Leaf(str(self.length), color_e.OtherConst)
+    L.append(field('length', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class word(pybase.CompoundObj):
+  _type_tag = 67
+  __slots__ = ('value',)
+
+  def __init__(self, value):
+    # type: (str) -> None
+    self.value = value
+
+  @staticmethod
+  def Create():
+    # type: () -> word
+    return word('')
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('word')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.value, color_e.StringConst)
+    L.append(field('value', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('word')
+    L = out_node.fields
+    x0 = NewLeaf(self.value, color_e.StringConst)
+    L.append(field('value', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class Token(pybase.CompoundObj):
+  _type_tag = 68
+  __slots__ = ('s', 'b')
+
+  def __init__(self, s, b):
+    # type: (str, bool) -> None
+    self.s = s
+    self.b = b
+
+  @staticmethod
+  def Create():
+    # type: () -> Token
+    return Token('', False)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Token')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.s, color_e.StringConst)
+    L.append(field('s', x0))
+
+    x1 = hnode.Leaf('T' if self.b else 'F', color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Token')
+    L = out_node.fields
+    x0 = NewLeaf(self.s, color_e.StringConst)
+    L.append(field('s', x0))
+
+    x1 = hnode.Leaf('T' if self.b else 'F', color_e.OtherConst)
+    L.append(field('b', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class maps(pybase.CompoundObj):
+  _type_tag = 69
+  __slots__ = ('ss', 'ib', 'tokens')
+
+  def __init__(self, ss, ib, tokens):
+    # type: (Optional[Dict[str, str]], Optional[Dict[int, bool]], Optional[Dict[str, Token]]) -> None
+    self.ss = ss
+    self.ib = ib
+    self.tokens = tokens
+
+  @staticmethod
+  def Create():
+    # type: () -> maps
+    return maps(None, None, None)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('maps')
+    L = out_node.fields
+
+    if self.ss is not None:  # map
+      m = hnode.Leaf("map", color_e.OtherConst)
+      x0 = hnode.Array([m])
+      for k0, v0 in self.ss.iteritems():
+        x0.children.append(NewLeaf(k0, color_e.StringConst))
+        x0.children.append(NewLeaf(v0, color_e.StringConst))
+      L.append(field('ss', x0))
+
+    if self.ib is not None:  # map
+      m = hnode.Leaf("map", color_e.OtherConst)
+      x1 = hnode.Array([m])
+      for k1, v1 in self.ib.iteritems():
+        x1.children.append(hnode.Leaf(str(k1), color_e.OtherConst))
+        x1.children.append(hnode.Leaf('T' if v1 else 'F', color_e.OtherConst))
+      L.append(field('ib', x1))
+
+    if self.tokens is not None:  # map
+      m = hnode.Leaf("map", color_e.OtherConst)
+      x2 = hnode.Array([m])
+      for k2, v2 in self.tokens.iteritems():
+        x2.children.append(NewLeaf(k2, color_e.StringConst))
+        x2.children.append(v2.PrettyTree())
+      L.append(field('tokens', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('maps')
+    L = out_node.fields
+    if self.ss is not None:  # map
+      m = hnode.Leaf("map", color_e.OtherConst)
+      x0 = hnode.Array([m])
+      for k0, v0 in self.ss.iteritems():
+        x0.children.append(NewLeaf(k0, color_e.StringConst))
+        x0.children.append(NewLeaf(v0, color_e.StringConst))
+      L.append(field('ss', x0))
+
+    if self.ib is not None:  # map
+      m = hnode.Leaf("map", color_e.OtherConst)
+      x1 = hnode.Array([m])
+      for k1, v1 in self.ib.iteritems():
+        x1.children.append(hnode.Leaf(str(k1), color_e.OtherConst))
+        x1.children.append(hnode.Leaf('T' if v1 else 'F', color_e.OtherConst))
+      L.append(field('ib', x1))
+
+    if self.tokens is not None:  # map
+      m = hnode.Leaf("map", color_e.OtherConst)
+      x2 = hnode.Array([m])
+      for k2, v2 in self.tokens.iteritems():
+        x2.children.append(NewLeaf(k2, color_e.StringConst))
+        x2.children.append(v2.AbbreviatedTree())
+      L.append(field('tokens', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class SetToArg_(pybase.CompoundObj):
+  _type_tag = 70
+  __slots__ = ('name', 'flag_type', 'quit_parsing_flags')
+
+  def __init__(self, name, flag_type, quit_parsing_flags):
+    # type: (str, Optional[flag_type_t], bool) -> None
+    self.name = name
+    self.flag_type = flag_type
+    self.quit_parsing_flags = quit_parsing_flags
+
+  @staticmethod
+  def Create():
+    # type: () -> SetToArg_
+    return SetToArg_('', None, False)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('SetToArg_')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    assert self.flag_type is not None
+    x1 = self.flag_type.PrettyTree()
+    L.append(field('flag_type', x1))
+
+    x2 = hnode.Leaf('T' if self.quit_parsing_flags else 'F', color_e.OtherConst)
+    L.append(field('quit_parsing_flags', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('SetToArg_')
+    L = out_node.fields
+    x0 = NewLeaf(self.name, color_e.StringConst)
+    L.append(field('name', x0))
+
+    assert self.flag_type is not None
+    x1 = self.flag_type.AbbreviatedTree()
+    L.append(field('flag_type', x1))
+
+    x2 = hnode.Leaf('T' if self.quit_parsing_flags else 'F', color_e.OtherConst)
+    L.append(field('quit_parsing_flags', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class Strings(pybase.CompoundObj):
+  _type_tag = 71
+  __slots__ = ('required', 'optional')
+
+  def __init__(self, required, optional):
+    # type: (str, Optional[Optional[str]]) -> None
+    self.required = required
+    self.optional = optional
+
+  @staticmethod
+  def Create():
+    # type: () -> Strings
+    return Strings('', None)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Strings')
+    L = out_node.fields
+
+    x0 = NewLeaf(self.required, color_e.StringConst)
+    L.append(field('required', x0))
+
+    if self.optional is not None:  # maybe
+      x1 = NewLeaf(self.optional, color_e.StringConst)
+      L.append(field('optional', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Strings')
+    L = out_node.fields
+    x0 = NewLeaf(self.required, color_e.StringConst)
+    L.append(field('required', x0))
+
+    if self.optional is not None:  # maybe
+      x1 = NewLeaf(self.optional, color_e.StringConst)
+      L.append(field('optional', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
+class Maybes(pybase.CompoundObj):
+  _type_tag = 72
+  __slots__ = ('op', 'arg')
+
+  def __init__(self, op, arg):
+    # type: (Optional[Optional[Token]], Optional[Optional[word]]) -> None
+    self.op = op
+    self.arg = arg
+
+  @staticmethod
+  def Create():
+    # type: () -> Maybes
+    return Maybes(None, None)
+
+  def PrettyTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Maybes')
+    L = out_node.fields
+
+    if self.op is not None:  # maybe
+      x0 = self.op.PrettyTree()
+      L.append(field('op', x0))
+
+    if self.arg is not None:  # maybe
+      x1 = self.arg.PrettyTree()
+      L.append(field('arg', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> hnode_t
+    out_node = NewRecord('Maybes')
+    L = out_node.fields
+    if self.op is not None:  # maybe
+      x0 = self.op.AbbreviatedTree()
+      L.append(field('op', x0))
+
+    if self.arg is not None:  # maybe
+      x1 = self.arg.AbbreviatedTree()
+      L.append(field('arg', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> hnode_t
+    return self._AbbreviatedTree()
+
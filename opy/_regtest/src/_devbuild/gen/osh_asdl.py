@@ -37,6 +37,7 @@ class bracket_op_e(object):
 
 class bracket_op(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('bracket_op')
+  __slots__ = ()
 
 class WholeArray(bracket_op):
   tag = 1
@@ -63,6 +64,7 @@ class suffix_op_e(object):
 
 class suffix_op(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('suffix_op')
+  __slots__ = ()
 
 class StringUnary(suffix_op):
   tag = 1
@@ -104,6 +106,7 @@ class array_item_e(object):
 
 class array_item(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('array_item')
+  __slots__ = ()
 
 class ArrayWord(array_item):
   tag = 1
@@ -143,6 +146,7 @@ class word_part_e(object):
 
 class word_part(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('word_part')
+  __slots__ = ()
 
 class ArrayLiteralPart(word_part):
   tag = 1
@@ -174,6 +178,7 @@ class EscapedLiteralPart(word_part):
 class EmptyPart(word_part):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('EmptyPart')
   tag = 4
+  __slots__ = ()
 
 class SingleQuotedPart(word_part):
   tag = 5
@@ -293,6 +298,7 @@ class word_e(object):
 
 class word(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('word')
+  __slots__ = ()
 
 class TokenWord(word):
   tag = 1
@@ -337,6 +343,7 @@ class lhs_expr_e(object):
 
 class lhs_expr(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('lhs_expr')
+  __slots__ = ()
 
 class LhsName(lhs_expr):
   tag = 1
@@ -369,6 +376,7 @@ class arith_expr_e(object):
 
 class arith_expr(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('arith_expr')
+  __slots__ = ()
 
 class ArithVarRef(arith_expr):
   tag = 1
@@ -461,6 +469,7 @@ class bool_expr_e(object):
 
 class bool_expr(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('bool_expr')
+  __slots__ = ()
 
 class WordTest(bool_expr):
   tag = 1
@@ -527,6 +536,7 @@ class redir_e(object):
 
 class redir(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('redir')
+  __slots__ = ()
 
 class Redir(redir):
   tag = 1
@@ -557,6 +567,7 @@ class HereDoc(redir):
 
 class assign_op_e(py_meta.SimpleObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('assign_op')
+  __slots__ = ()
 
 assign_op_e.Equal = assign_op_e(1, 'Equal')
 assign_op_e.PlusEqual = assign_op_e(2, 'PlusEqual')
@@ -604,10 +615,12 @@ class iterable_e(object):
 
 class iterable(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('iterable')
+  __slots__ = ()
 
 class IterArgv(iterable):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('IterArgv')
   tag = 1
+  __slots__ = ()
 
 class IterArray(iterable):
   tag = 2
@@ -643,10 +656,12 @@ class command_e(object):
 
 class command(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('command')
+  __slots__ = ()
 
 class NoOp(command):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('NoOp')
   tag = 1
+  __slots__ = ()
 
 class SimpleCommand(command):
   tag = 2
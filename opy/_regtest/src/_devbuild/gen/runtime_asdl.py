@@ -8,6 +8,7 @@ class part_value_e(object):
 
 class part_value(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('part_value')
+  __slots__ = ()
 
 class StringPartValue(part_value):
   tag = 1
@@ -35,10 +36,12 @@ class value_e(object):
 
 class value(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('value')
+  __slots__ = ()
 
 class Undef(value):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('Undef')
   tag = 1
+  __slots__ = ()
 
 class Str(value):
   tag = 2
@@ -70,12 +73,14 @@ class cell(py_meta.CompoundObj):
 
 class var_flags_e(py_meta.SimpleObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('var_flags')
+  __slots__ = ()
 
 var_flags_e.Exported = var_flags_e(1, 'Exported')
 var_flags_e.ReadOnly = var_flags_e(2, 'ReadOnly')
 
 class scope_e(py_meta.SimpleObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('scope')
+  __slots__ = ()
 
 scope_e.TempEnv = scope_e(1, 'TempEnv')
 scope_e.LocalOnly = scope_e(2, 'LocalOnly')
@@ -88,6 +93,7 @@ class lvalue_e(object):
 
 class lvalue(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('lvalue')
+  __slots__ = ()
 
 class LhsName(lvalue):
   tag = 1
@@ -115,6 +121,7 @@ class redirect_e(object):
 
 class redirect(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('redirect')
+  __slots__ = ()
 
 class PathRedirect(redirect):
   tag = 1
@@ -154,6 +161,7 @@ class job_status_e(object):
 
 class job_status(py_meta.CompoundObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('job_status')
+  __slots__ = ()
 
 class ProcessStatus(job_status):
   tag = 1
@@ -175,6 +183,7 @@ class PipelineStatus(job_status):
 
 class span_e(py_meta.SimpleObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('span')
+  __slots__ = ()
 
 span_e.Black = span_e(1, 'Black')
 span_e.Delim = span_e(2, 'Delim')
@@ -182,6 +191,7 @@ span_e.Backslash = span_e(3, 'Backslash')
 
 class builtin_e(py_meta.SimpleObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('builtin')
+  __slots__ = ()
 
 builtin_e.NONE = builtin_e(1, 'NONE')
 builtin_e.READ = builtin_e(2, 'READ')
@@ -220,6 +230,7 @@ builtin_e.TYPESET = builtin_e(34, 'TYPESET')
 
 class effect_e(py_meta.SimpleObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('effect')
+  __slots__ = ()
 
 effect_e.SpliceParts = effect_e(1, 'SpliceParts')
 effect_e.Error = effect_e(2, 'Error')
@@ -228,12 +239,14 @@ effect_e.NoOp = effect_e(4, 'NoOp')
 
 class process_state_e(py_meta.SimpleObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('process_state')
+  __slots__ = ()
 
 process_state_e.Init = process_state_e(1, 'Init')
 process_state_e.Done = process_state_e(2, 'Done')
 
 class completion_state_e(py_meta.SimpleObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('completion_state')
+  __slots__ = ()
 
 completion_state_e.NONE = completion_state_e(1, 'NONE')
 completion_state_e.FIRST = completion_state_e(2, 'FIRST')
@@ -244,6 +257,7 @@ completion_state_e.REDIR_FILENAME = completion_state_e(6, 'REDIR_FILENAME')
 
 class word_style_e(py_meta.SimpleObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('word_style')
+  __slots__ = ()
 
 word_style_e.Expr = word_style_e(1, 'Expr')
 word_style_e.Unquoted = word_style_e(2, 'Unquoted')
@@ -4,6 +4,7 @@ from osh.meta import TYPES_TYPE_LOOKUP as TYPE_LOOKUP
 
 class bool_arg_type_e(py_meta.SimpleObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('bool_arg_type')
+  __slots__ = ()
 
 bool_arg_type_e.Undefined = bool_arg_type_e(1, 'Undefined')
 bool_arg_type_e.Path = bool_arg_type_e(2, 'Path')
@@ -13,6 +14,7 @@ bool_arg_type_e.Other = bool_arg_type_e(5, 'Other')
 
 class redir_arg_type_e(py_meta.SimpleObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('redir_arg_type')
+  __slots__ = ()
 
 redir_arg_type_e.Path = redir_arg_type_e(1, 'Path')
 redir_arg_type_e.Desc = redir_arg_type_e(2, 'Desc')
@@ -20,6 +22,7 @@ redir_arg_type_e.Here = redir_arg_type_e(3, 'Here')
 
 class lex_mode_e(py_meta.SimpleObj):
   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('lex_mode')
+  __slots__ = ()
 
 lex_mode_e.NONE = lex_mode_e(1, 'NONE')
 lex_mode_e.COMMENT = lex_mode_e(2, 'COMMENT')
@@ -4,6 +4,7 @@ from __future__ import print_function
 arith_ast_test.py: Tests for arith_ast.py
 """
 
+import copy
 import cStringIO
 import unittest
 
@@ -52,6 +53,10 @@ class ArithAstTest(unittest.TestCase):
     self.assertEqual('x', t.value)
     self.assertEqual(const.NO_INTEGER, t.span_id)
 
+    self.assertEqual(('a',), Slice.REQUIRED_FIELDS)
+    self.assertEqual(('begin', 'end', 'stride'), Slice.MAYBE_FIELDS)
+    self.assertEqual(('spids',), Slice.ARRAY_FIELDS)
+
   def testTypeCheck(self):
     v = ArithVar('name')
     # Integer is not allowed
@@ -61,6 +66,16 @@ class ArithAstTest(unittest.TestCase):
     # Raw integer is not allowed
     self.assertRaises(AssertionError, ArithUnary, op_id_e.Minus, 99)
 
+    # bool is a subclass of int, but it's not allowed
+    self.assertRaises(AssertionError, Const, True)
+
+    # A class is not an instance
+    self.assertRaises(AssertionError, ArithUnary, op_id_e.Minus, Const)
+    self.assertRaises(AssertionError, Slice, Const(1), Const)
+
+    # Only the singletons made by MakeTypes() are valid enum values
+    self.assertRaises(AssertionError, ArithUnary, op_id_e(1, 'Plus'), Const(1))
+
     v = ArithUnary(op_id_e.Minus, Const(99))
     # Raw integer is not allowed
     #self.assertRaises(AssertionError, ArithUnary, op_id_e.Minus, op_id_e.Plus)
@@ -121,6 +136,21 @@ class ArithAstTest(unittest.TestCase):
     else:
       raise AssertionError("Should have failed")
 
+  def testCopy(self):
+    n = ArithBinary(op_id_e.Plus, Const(1), Const(2))
+    for n2 in (copy.copy(n), copy.deepcopy(n)):
+      self.assertEqual(ArithBinary, n2.__class__)
+      # Simple sum values are singletons
+      self.assertTrue(n2.op_id is op_id_e.Plus)
+      n2.CheckUnassigned()
+      n2.right = Const(3)  # still type checked
+      self.assertRaises(AssertionError, setattr, n2, 'right', 3)
+    self.assertFalse(copy.deepcopy(n).left is n.left)
+
+    # Unassigned fields stay unassigned
+    n = copy.deepcopy(ArithBinary())
+    self.assertRaises(ValueError, n.CheckUnassigned)
+
   def testProductType(self):
     print()
     print('-- PRODUCT --')
@@ -138,6 +168,10 @@ class ArithAstTest(unittest.TestCase):
     # Implementation detail for dynamic type checking
     assert isinstance(s, py_meta.CompoundObj)
 
+    # Fields are stored in __slots__
+    self.assertRaises(AttributeError, setattr, s, 'foo', 1)
+    assert not hasattr(s, '__dict__')
+
   def testSimpleSumType(self):
     # TODO: Should be op_id_i.Plus -- instance
     # Should be op_id_s.Plus
@@ -169,6 +203,18 @@ class ArithAstTest(unittest.TestCase):
   def testOtherTypes(self):
     c = Const(66)
     print(c)
+    self.assertEqual('(Const i:66)', c.PrettyTree())
+
+    # repr() doesn't format the tree unless AST_REPR=pretty
+    pretty_repr = py_meta._PRETTY_REPR
+    try:
+      py_meta._PRETTY_REPR = False
+      self.assertEqual('<Const ...>', repr(c))
+      self.assertEqual('[<Const ...>]', repr([c]))
+      py_meta._PRETTY_REPR = True
+      self.assertEqual('(Const i:66)', repr(c))
+    finally:
+      py_meta._PRETTY_REPR = pretty_repr
 
     print((Slice(Const(1), Const(5), Const(2))))
 
@@ -178,7 +224,7 @@ class ArithAstTest(unittest.TestCase):
     print(arith_expr)
 
     # Invalid because only half were assigned
-    #print(ArithBinary(op_id_e.Plus, Const(5)))
+    self.assertRaises(ValueError, ArithBinary, op_id_e.Plus, Const(5))
 
     n = ArithBinary()
     #n.CheckUnassigned()
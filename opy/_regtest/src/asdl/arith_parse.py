@@ -222,7 +222,7 @@ def ParseShell(s, expected=None):
   p = MakeParser(s)
   tree = p.Parse()
 
-  sexpr = repr(tree)
+  sexpr = tree.PrettyTree()
   if expected is not None:
     assert sexpr == expected, '%r != %r' % (sexpr, expected)
 
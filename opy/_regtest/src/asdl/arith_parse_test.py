@@ -196,7 +196,7 @@ def t_parse(s, expected=None):
   p = arith_parse.MakeParser(s)
   tree = p.Parse()
 
-  print(tree)
+  print(tree.PrettyTree())
 
   #v = PrettyPrinter()
   #v.Visit(tree)
@@ -53,7 +53,7 @@ def main(argv):
 
     obj = arith_parse.ParseShell(expr)
     print('Encoding %r into binary:' % expr)
-    print(obj)
+    print(obj.PrettyTree())
 
     enc = encode.Params()
     with open(out_path, 'wb') as f:
@@ -19,6 +19,7 @@ class GenClassesVisitor(visitor.AsdlVisitor):
   def VisitSimpleSum(self, sum, name, depth):
     self.Emit('class %s_e(py_meta.SimpleObj):' % name, depth)
     self.Emit('  ASDL_TYPE = TYPE_LOOKUP.ByTypeName(%r)' % name, depth)
+    self.Emit('  __slots__ = ()', depth)
     self.Emit('', depth)
 
     # Just use #define, since enums aren't namespaced.
@@ -81,6 +82,7 @@ class GenClassesVisitor(visitor.AsdlVisitor):
       self.Emit("class %s(%s):" % (cons.name, def_name), depth)
       self.Emit('  ASDL_TYPE = TYPE_LOOKUP.ByTypeName(%r)' % cons.name, depth)
       self.Emit('  tag = %d'  % tag_num, depth)
+      self.Emit('  __slots__ = ()', depth)
       self.Emit('', depth)
 
   def VisitCompoundSum(self, sum, name, depth):
@@ -92,6 +94,7 @@ class GenClassesVisitor(visitor.AsdlVisitor):
 
     self.Emit('class %s(py_meta.CompoundObj):' % name, depth)
     self.Emit('  ASDL_TYPE = TYPE_LOOKUP.ByTypeName(%r)' % name, depth)
+    self.Emit('  __slots__ = ()', depth)
     self.Emit('', depth)
 
     # define command_t, and then make subclasses
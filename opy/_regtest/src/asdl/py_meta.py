@@ -26,6 +26,9 @@ implementation has to differ from what's generated by asdl_c.py.  More simply
 put: an op is Add() and not Add, an instance of a class, not an integer value.
 """
 
+import itertools
+import os
+
 from asdl import asdl_ as asdl
 from asdl import const
 from asdl import format as fmt
@@ -33,6 +36,55 @@ from core import util
 
 log = util.log
 
+# repr() of a CompoundObj is cheap unless AST_REPR=pretty is set.  Otherwise
+# log statements and container reprs would format the whole subtree.
+_PRETTY_REPR = os.getenv('AST_REPR') == 'pretty'
+
+
+def _CheckConstructor(value, desc):
+  # This doesn't make sense because the descriptors are derived from the
+  # declared types.  You can declare a field as arith_expr_e but not
+  # ArithBinary.
+  raise AssertionError("Invalid Constructor descriptor")
+
+
+def _CheckProduct(value, desc):
+  # Look on type(value), so a class isn't mistaken for an instance.  None for
+  # primitives, which aren't of the right type.
+  return getattr(type(value), 'ASDL_TYPE', None) is desc
+
+
+def _CheckSum(value, desc):
+  # _simple, _member_ids, and _type_set are stamped on by MakeTypes().  Compute
+  # them for a Sum that didn't go through it.
+  simple = getattr(desc, '_simple', None)
+  if simple is None:
+    simple = asdl.is_simple(desc)
+
+  # As above, primitives give None.
+  actual_desc = getattr(type(value), 'ASDL_TYPE', None)
+  if simple:
+    member_ids = getattr(desc, '_member_ids', None)
+    if member_ids is None:
+      # There are no singletons to compare against.
+      return actual_desc is desc
+    # The SimpleObj values are singletons, so we can compare identities.
+    return id(value) in member_ids
+
+  # It has to be one of the alternatives.
+  return actual_desc in getattr(desc, '_type_set', desc.types)
+
+
+# Descriptor class -> function(value, desc) that returns whether value is of
+# that type.  Looking up the exact class avoids a chain of isinstance() calls.
+# Primitive, Maybe, and Array descriptors are handled by _MakeChecker().
+_CHECKERS = {
+    asdl.Constructor: _CheckConstructor,
+    asdl.UserType: lambda value, desc: isinstance(value, desc.typ),
+    asdl.Product: _CheckProduct,
+    asdl.Sum: _CheckSum,
+}
+
 
 def _CheckType(value, expected_desc):
   """Is value of type expected_desc?
@@ -42,71 +94,34 @@ def _CheckType(value, expected_desc):
     expected_desc: instance of asdl.Product, asl.Sum, asdl.StrType,
       asdl.IntType, ArrayType, MaybeType, etc.
   """
-  if isinstance(expected_desc, asdl.Constructor):
-    # This doesn't make sense because the descriptors are derived from the
-    # declared types.  You can declare a field as arith_expr_e but not
-    # ArithBinary.
-    raise AssertionError("Invalid Constructor descriptor")
-
-  if isinstance(expected_desc, asdl.MaybeType):
-    if value is None:
-      return True
-    return _CheckType(value, expected_desc.desc)
-
-  if isinstance(expected_desc, asdl.ArrayType):
-    if not isinstance(value, list):
-      return False
-    # Now check all entries
-    for item in value:
-      if not _CheckType(item, expected_desc.desc):
-        return False
-    return True
-
-  if isinstance(expected_desc, asdl.StrType):
-    return isinstance(value, str)
-
-  if isinstance(expected_desc, asdl.IntType):
-    return isinstance(value, int)
-
-  if isinstance(expected_desc, asdl.BoolType):
-    return isinstance(value, bool)
-
-  if isinstance(expected_desc, asdl.UserType):
-    return isinstance(value, expected_desc.typ)
-
-  try:
-    actual_desc = value.__class__.ASDL_TYPE
-  except AttributeError:
-    return False  # it's not of the right type
-
-  if isinstance(expected_desc, asdl.Product):
-    return actual_desc is expected_desc
-
-  if isinstance(expected_desc, asdl.Sum):
-    if asdl.is_simple(expected_desc):
-      return actual_desc is expected_desc
-    else:
-      for cons in expected_desc.types:  # It has to be one of the alternatives
-        #log("CHECKING desc %s against %s" % (desc, cons))
-        if actual_desc is cons:
-          return True
-      return False
-
-  raise AssertionError(
-      'Invalid descriptor %r: %r' % (expected_desc.__class__, expected_desc))
+  check = _CHECKERS.get(expected_desc.__class__)
+  if check is None:
+    # Not on the hot path: fields use the checkers cached by
+    # _MakeFieldDescriptors().
+    return _MakeChecker(expected_desc)(value)
+  return check(value, expected_desc)
 
 
 class Obj(object):
   # NOTE: We're using CAPS for these static fields, since they are constant at
   # runtime after metaprogramming.
+  #
+  # MakeTypes() sets ASDL_TYPE in the dict of each Product, Constructor, and
+  # simple sum class, so _CheckProduct() and _CheckSum() find it on the first
+  # class in the MRO.  The base class of a compound sum gets none, since values
+  # are always instances of a Constructor subclass.
   ASDL_TYPE = None  # Used for type checking
 
+  __slots__ = ()
+
 
 class SimpleObj(Obj):
   """An enum value.
 
   Other simple objects: int, str, maybe later a float.
   """
+  __slots__ = ('enum_id', 'name')
+
   def __init__(self, enum_id, name):
     self.enum_id = enum_id
     self.name = name
@@ -119,11 +134,22 @@ class SimpleObj(Obj):
   # class bool_arg_type_e(py_meta.SimpleObj):
   #   ASDL_TYPE = TYPE_LOOKUP.ByTypeName('bool_arg_type')
   # bool_arg_type_e.Undefined = bool_arg_type_e(1, 'Undefined')
+  #
+  # For the classes made by MakeTypes(), only those class attributes are valid
+  # values.  A new bool_arg_type_e(1, 'Undefined') fails type checks, even
+  # though it has the same fields.
 
   def __hash__(self):
     # Could it be the integer self.enum_id?
     return hash(self.__class__.__name__ + self.name)
 
+  # The values are singletons, and _CheckSum() compares them by identity.
+  def __copy__(self):
+    return self
+
+  def __deepcopy__(self, memo):
+    return self
+
   def __repr__(self):
     return '<%s %s %s>' % (self.__class__.__name__, self.name, self.enum_id)
 
@@ -134,96 +160,251 @@ class CompoundObj(Obj):
   # types.  Never set for product types.
   tag = None
 
+  __slots__ = ()
+
   # NOTE: SimpleObj could share this.
-  def __repr__(self):
+  def PrettyTree(self):
+    """Return the whole tree as a string.  This is O(size of the tree)."""
     ast_f = fmt.TextOutput(util.Buffer())  # No color by default.
     tree = fmt.MakeTree(self)
     fmt.PrintTree(tree, ast_f)
     s, _ = ast_f.GetRaw()
     return s
 
+  def __repr__(self):
+    if _PRETTY_REPR:
+      return self.PrettyTree()
+    return '<%s ...>' % self.__class__.__name__
+
+  def _repr_pretty_(self, p, cycle):
+    """Hook for IPython, so interactive use still shows the tree."""
+    p.text(self.PrettyTree())
+
 
 class DebugCompoundObj(CompoundObj):
   """A CompoundObj that does dynamic type checks.
 
-  Used by MakeTypes().
+  Used by MakeTypes(), which also generates an __init__ for each subclass.
   """
   # Always set for constructor types, which are subclasses of sum types.  Never
   # set for product types.
   tag = None
 
-  def __init__(self, *args, **kwargs):
-    # The user must specify ALL required fields or NONE.
-    self._assigned = {f: False for f in self.ASDL_TYPE.GetFieldNames()}
-    self._SetDefaults()
-    if args or kwargs:
-      self._Init(args, kwargs)
-
-  def _SetDefaults(self):
-    for name, desc in self.ASDL_TYPE.GetFields():
-
-      if isinstance(desc, asdl.MaybeType):
-        child = desc.desc
-        if isinstance(child, asdl.IntType):
-          value = const.NO_INTEGER
-        elif isinstance(child, asdl.StrType):
-          value = ''
-        else:
-          value = None
-        self.__setattr__(name, value)  # Maybe values can be None
-
-      elif isinstance(desc, asdl.ArrayType):
-        self.__setattr__(name, [])
-
-  def _Init(self, args, kwargs):
-    field_names = list(self.ASDL_TYPE.GetFieldNames())
-    for i, val in enumerate(args):
-      name = field_names[i]
-      self.__setattr__(name, val)
-
-    for name, val in kwargs.items():
-      if self._assigned[name]:
-        raise TypeError('Duplicate assignment of field %r' % name)
-      self.__setattr__(name, val)
-
-    # Disable type checking here
-    #return
-    for name in field_names:
-      if not self._assigned[name]:
-        # If anything was set, then required fields raise an error.
-        raise ValueError("Field %r is required and wasn't initialized" % name)
+  # Subclasses add a slot for each field.  Bit i of _assigned_mask is set when
+  # FIELDS[i] is assigned.
+  __slots__ = ('_assigned_mask',)
+
+  # Set by _MakeFieldDescriptors().
+  DESCRIPTOR_LOOKUP = {}  # field name -> (descriptor, checker, bit)
+  FIELDS = ()  # all field names, in order
+  MAYBE_FIELDS = ()
+  ARRAY_FIELDS = ()
+  REQUIRED_FIELDS = ()  # neither Maybe nor Array
+  REQUIRED_MASK = 0  # bits of REQUIRED_FIELDS
 
   def CheckUnassigned(self):
     """See if there are unassigned fields, for later encoding.
 
     This is currently only used in unit tests.
     """
-    unassigned = []
-    for name in self.ASDL_TYPE.GetFieldNames():
-      if not self._assigned[name]:
-        desc = self.ASDL_TYPE.LookupFieldType(name)
-        if not isinstance(desc, asdl.MaybeType):
-          unassigned.append(name)
-    if unassigned:
+    # Maybe and Array fields always have defaults.
+    missing = self.REQUIRED_MASK & ~self._assigned_mask
+    if missing:
+      unassigned = [
+          name for i, name in enumerate(self.FIELDS) if missing & (1 << i)]
       raise ValueError("Fields %r were't be assigned" % unassigned)
 
+  # copy and pickle restore slots with setattr(), which would go through the
+  # type-checking __setattr__ below.  Store them directly instead.
+  def __getstate__(self):
+    state = {}
+    for name in ('_assigned_mask',) + self.FIELDS:
+      if hasattr(self, name):  # unassigned fields have no value
+        state[name] = getattr(self, name)
+    return state
+
+  def __setstate__(self, state):
+    for name, value in state.items():
+      object.__setattr__(self, name, value)
+
   if 1:  # Disable type checking here
     def __setattr__(self, name, value):
-      if name == '_assigned':
-        self.__dict__[name] = value
-        return
       try:
-        desc = self.ASDL_TYPE.LookupFieldType(name)
+        desc, check, bit = self.DESCRIPTOR_LOOKUP[name]
       except KeyError:
         raise AttributeError('Object of type %r has no attribute %r' %
                              (self.__class__.__name__, name))
 
-      if not _CheckType(value, desc):
-        raise AssertionError("Field %r should be of type %s, got %r (%s)" %
-                             (name, desc, value, value.__class__))
+      if not check(value):
+        raise _FieldTypeError(name, desc, value)
+
+      # check this later when encoding
+      object.__setattr__(self, '_assigned_mask', self._assigned_mask | bit)
+      object.__setattr__(self, name, value)
+
 
-      self._assigned[name] = True  # check this later when encoding
-      self.__dict__[name] = value
+_PRIMITIVE_TYPES = {
+    asdl.StrType: str,
+    asdl.IntType: int,
+}
+
+
+def _MakeChecker(desc):
+  """Returns a function(value) -> bool that checks a value against desc.
+
+  This resolves the descriptor once, rather than dispatching in _CheckType()
+  on every assignment.  Descriptors that refer to other types use the
+  functions in _CHECKERS.
+  """
+  typ = _PRIMITIVE_TYPES.get(desc.__class__)
+  if typ is not None:
+    return lambda value: type(value) is typ
+
+  if isinstance(desc, asdl.BoolType):
+    return lambda value: value is True or value is False  # only two bools
+
+  if isinstance(desc, asdl.MaybeType):
+    check_child = _MakeChecker(desc.desc)
+    return lambda value: value is None or check_child(value)
+
+  if isinstance(desc, asdl.ArrayType):
+    # Check all entries without a Python-level loop.  imap() is lazy, so all()
+    # stops at the first bad entry.
+    check_item = _MakeChecker(desc.desc)
+    return lambda value: type(value) is list and all(
+        itertools.imap(check_item, value))
+
+  check = _CHECKERS.get(desc.__class__)
+  if check is None:
+    raise AssertionError('Invalid descriptor %r: %r' % (desc.__class__, desc))
+  return lambda value: check(value, desc)
+
+
+def _FieldTypeError(name, desc, value):
+  return AssertionError("Field %r should be of type %s, got %r (%s)" %
+                        (name, desc, value, value.__class__))
+
+
+def _FieldDefault(desc):
+  """Returns the source for the default value of a field, or None."""
+  if isinstance(desc, asdl.MaybeType):
+    child = desc.desc
+    if isinstance(child, asdl.IntType):
+      return repr(const.NO_INTEGER)
+    elif isinstance(child, asdl.StrType):
+      return "''"
+    else:
+      return 'None'  # Maybe values can be None
+
+  if isinstance(desc, asdl.ArrayType):
+    return '[]'
+
+  return None  # required
+
+
+_MISSING = object()  # Default for __init__ args that weren't passed.
+
+
+def _MakeInit(class_name, fields):
+  """Generate an __init__ specialized to the fields of a Product/Constructor.
+
+  The user must specify ALL required fields or NONE.  Each value is checked
+  once and stored directly, instead of going through the generic __setattr__.
+
+  Args:
+    class_name: for the generated code object
+    fields: list of (name, descriptor, checker)
+  """
+  names = [name for name, _, _ in fields]
+
+  free_vars = ['_MISSING', '_set', '_FieldTypeError']
+  free_values = [_MISSING, object.__setattr__, _FieldTypeError]
+
+  # Nothing passed: set defaults and leave required fields unassigned.
+  body = []
+  if names:
+    body.append('if %s:' % ' and '.join('%s is _MISSING' % n for n in names))
+  default_mask = 0
+  for i, (name, desc, _) in enumerate(fields):
+    default = _FieldDefault(desc)
+    if default is not None:
+      body.append('  _set(self, %r, %s)' % (name, default))
+      default_mask |= 1 << i
+  if names:
+    body.append('  _set(self, %r, %d)' % ('_assigned_mask', default_mask))
+    body.append('  return')
+
+  for i, (name, desc, check) in enumerate(fields):
+    d = '_d%d' % i
+    c = '_c%d' % i
+    free_vars.extend([d, c])
+    free_values.extend([desc, check])
+
+    default = _FieldDefault(desc)
+    body.append('if %s is _MISSING:' % name)
+    if default is None:
+      # If anything was set, then required fields raise an error.
+      body.append(
+          "  raise ValueError(\"Field %r is required and wasn't initialized\")"
+          % name)
+      body.append('if not %s(%s):' % (c, name))
+    else:
+      body.append('  %s = %s' % (name, default))
+      body.append('elif not %s(%s):' % (c, name))
+    body.append('  raise _FieldTypeError(%r, %s, %s)' % (name, d, name))
+    body.append('_set(self, %r, %s)' % (name, name))
+
+  all_mask = (1 << len(fields)) - 1
+  body.append('_set(self, %r, %d)' % ('_assigned_mask', all_mask))
+
+  # Use a closure so the generated code doesn't do global lookups.
+  lines = ['def _Make(%s):' % ', '.join(free_vars)]
+  lines.append('  def __init__(%s):' %
+               ', '.join(['self'] + ['%s=_MISSING' % n for n in names]))
+  lines.extend('    ' + line for line in body)
+  lines.append('  return __init__')
+
+  namespace = {}
+  code = compile('\n'.join(lines) + '\n', '<%s.__init__>' % class_name, 'exec')
+  exec(code, namespace)
+  return namespace['_Make'](*free_values)
+
+
+def _MakeFieldDescriptors(class_name, typ, class_attr):
+  """Add the per-field attributes of a Product/Constructor class.
+
+  Args:
+    class_name: name of the class being created
+    typ: asdl.Product or asdl.Constructor
+    class_attr: dict to add attributes to
+  """
+  desc_lookup = {}
+  fields = []
+  maybe_fields = []
+  array_fields = []
+  required_fields = []
+  for i, (name, desc) in enumerate(typ.GetFields()):
+    check = _MakeChecker(desc)
+    desc_lookup[name] = (desc, check, 1 << i)
+    fields.append((name, desc, check))
+
+    if isinstance(desc, asdl.MaybeType):
+      maybe_fields.append(name)
+    elif isinstance(desc, asdl.ArrayType):
+      array_fields.append(name)
+    else:
+      required_fields.append(name)
+
+  class_attr['DESCRIPTOR_LOOKUP'] = desc_lookup
+  class_attr['FIELDS'] = tuple(name for name, _, _ in fields)
+  class_attr['MAYBE_FIELDS'] = tuple(maybe_fields)
+  class_attr['ARRAY_FIELDS'] = tuple(array_fields)
+  class_attr['REQUIRED_FIELDS'] = tuple(required_fields)
+  class_attr['REQUIRED_MASK'] = sum(
+      desc_lookup[name][2] for name in required_fields)
+
+  class_attr['__slots__'] = class_attr['FIELDS']
+  class_attr['__init__'] = _MakeInit(class_name, fields)
 
 
 def MakeTypes(module, root, type_lookup):
@@ -238,7 +419,11 @@ def MakeTypes(module, root, type_lookup):
     #print('TYPE', defn.name, typ)
     if isinstance(typ, asdl.Sum):
       sum_type = typ
-      if asdl.is_simple(sum_type):
+      # Precomputed for _CheckSum()
+      sum_type._simple = asdl.is_simple(sum_type)
+      sum_type._type_set = frozenset(sum_type.types)
+
+      if sum_type._simple:
         # An object without fields, which can be stored inline.
         
         # Create a class called foo_e.  Unlike the CompoundObj case, it doesn't
@@ -251,13 +436,14 @@ def MakeTypes(module, root, type_lookup):
         # change.  I haven't run into this problem in practice yet.
 
         class_name = defn.name + '_e'
-        class_attr = {'ASDL_TYPE': sum_type}  # asdl.Sum
+        class_attr = {'ASDL_TYPE': sum_type, '__slots__': ()}  # asdl.Sum
         cls = type(class_name, (SimpleObj, ), class_attr)
         setattr(root, class_name, cls)
 
         # NOTE: Right now the ASDL_TYPE for for an enum value is the Sum type,
         # not the Constructor type.  We may want to change this if we need
         # reflection.
+        member_ids = []
         for i, cons in enumerate(sum_type.types):
           enum_id = i + 1
           name = cons.name
@@ -265,12 +451,16 @@ def MakeTypes(module, root, type_lookup):
 
           # Set a static attribute like op_id.Plus, op_id.Minus.
           setattr(cls, name, val)
+          member_ids.append(id(val))
+
+        # The values are kept alive by cls, so their ids are stable.
+        sum_type._member_ids = frozenset(member_ids)  # for _CheckSum()
       else:
         tag_num = {}
 
         # e.g. for arith_expr
         # Should this be arith_expr_t?  It is in C++.
-        base_class = type(defn.name, (DebugCompoundObj, ), {})
+        base_class = type(defn.name, (DebugCompoundObj, ), {'__slots__': ()})
         setattr(root, defn.name, base_class)
 
         # Make a type and a enum tag for each alternative.
@@ -282,6 +472,7 @@ def MakeTypes(module, root, type_lookup):
               'ASDL_TYPE': cons,  # asdl.Constructor
               'tag': tag,  # Does this API change?
           }
+          _MakeFieldDescriptors(cons.name, cons, class_attr)
 
           cls = type(cons.name, (base_class, ), class_attr)
           setattr(root, cons.name, cls)
@@ -293,6 +484,7 @@ def MakeTypes(module, root, type_lookup):
 
     elif isinstance(typ, asdl.Product):
       class_attr = {'ASDL_TYPE': typ}
+      _MakeFieldDescriptors(defn.name, typ, class_attr)
       cls = type(defn.name, (DebugCompoundObj, ), class_attr)
       setattr(root, defn.name, cls)
 
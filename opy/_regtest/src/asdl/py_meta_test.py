@@ -6,6 +6,7 @@ py_meta_test.py: Tests for py_meta.py
 
 import unittest
 
+from asdl import asdl_ as asdl
 from asdl import py_meta  # module under test
 
 class AsdlTest(unittest.TestCase):
@@ -13,6 +14,46 @@ class AsdlTest(unittest.TestCase):
   def testPyMeta(self):
     print(py_meta)
 
+  def testCheckArray(self):
+    # A descriptor that didn't come from MakeTypes()
+    desc = asdl.ArrayType(asdl.IntType())
+    self.assertEqual(True, py_meta._CheckType([1, 2], desc))
+    self.assertEqual(False, py_meta._CheckType([1, 'x'], desc))
+    self.assertEqual(False, py_meta._CheckType((1, 2), desc))
+
+    self.assertRaises(AssertionError, py_meta._CheckType, [1], object())
+
+  def testCheckSum(self):
+    # Sums that didn't come from MakeTypes(), so nothing is precomputed.
+    foo = asdl.Constructor('Foo', [asdl.Field('int', 'i')])
+    desc = asdl.Sum([foo, asdl.Constructor('Bar')])
+
+    class Foo(py_meta.CompoundObj):
+      ASDL_TYPE = foo
+
+    self.assertEqual(True, py_meta._CheckType(Foo(), desc))
+    self.assertEqual(False, py_meta._CheckType(Foo, desc))
+    self.assertEqual(False, py_meta._CheckType(1, desc))
+
+    simple = asdl.Sum([asdl.Constructor('A'), asdl.Constructor('B')])
+
+    class simple_e(py_meta.SimpleObj):
+      ASDL_TYPE = simple
+
+    self.assertEqual(True, py_meta._CheckType(simple_e(1, 'A'), simple))
+    self.assertEqual(False, py_meta._CheckType(Foo(), simple))
+    self.assertEqual(False, py_meta._CheckType('A', simple))
+
+  def testCheckPrimitive(self):
+    self.assertEqual(True, py_meta._CheckType('x', asdl.StrType()))
+    self.assertEqual(False, py_meta._CheckType(1, asdl.BoolType()))
+    self.assertEqual(True, py_meta._CheckType(False, asdl.BoolType()))
+
+    desc = asdl.MaybeType(asdl.IntType())
+    self.assertEqual(True, py_meta._CheckType(None, desc))
+    self.assertEqual(True, py_meta._CheckType(3, desc))
+    self.assertEqual(False, py_meta._CheckType('3', desc))
+
 
 if __name__ == '__main__':
   unittest.main()
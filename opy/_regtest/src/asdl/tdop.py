@@ -75,9 +75,13 @@ class Node(object):
     """
     self.token = token
 
-  def __repr__(self):
+  def PrettyTree(self):
+    # Same method name as py_meta.CompoundObj, which can be a child.
     return str(self.token.val)
 
+  def __repr__(self):
+    return self.PrettyTree()
+
 
 class CompositeNode(Node):
   def __init__(self, token, children):
@@ -88,10 +92,13 @@ class CompositeNode(Node):
     Node.__init__(self, token)
     self.children = children
 
-  def __repr__(self):
-    args = ''.join([" " + repr(c) for c in self.children])
+  def PrettyTree(self):
+    args = ''.join([" " + c.PrettyTree() for c in self.children])
     return "(" + self.token.type + args + ")"
 
+  def __repr__(self):
+    return self.PrettyTree()
+
 
 #
 # Parser definition
@@ -497,10 +497,12 @@ def _GetCompletionType(w_parser, c_parser, ev, status_out):
       prev_token, cur_token, cur_word)
   status_out.Write(2, 'comp_state %s  error %s', comp_state, c_parser.Error())
   # This one can be multiple lines
-  status_out.Write(3, 'node: %s %s', repr(node) if node else '<Parse Error>',
+  status_out.Write(3, 'node: %s %s',
+                    node.PrettyTree() if node else '<Parse Error>',
                     node.tag if node else '')
   # This one can be multiple lines
-  status_out.Write(6, 'com_node: %s', repr(com_node) if com_node else '<None>')
+  status_out.Write(6, 'com_node: %s',
+                   com_node.PrettyTree() if com_node else '<None>')
 
   # TODO: Fill these in
   comp_type = completion_state_e.FIRST
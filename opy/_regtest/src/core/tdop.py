@@ -20,7 +20,7 @@ def Assert(s, expected, tree):
   """Used for tests."""
   print(s)
   if expected is not None:
-    sexpr = repr(tree)
+    sexpr = tree.PrettyTree()
     assert sexpr == expected, '%r != %r' % (sexpr, expected)
 
 
@@ -133,7 +133,7 @@ def LeftAssign(p, w, left, rbp):
   # x += 1, or a[i] += 1
   lhs = ToLValue(left)
   if lhs is None:
-    p_die("Can't assign to %r", lhs, word=w)
+    p_die("Can't assign to %s", left.PrettyTree(), word=w)
   return ast.BinaryAssign(word.ArithId(w), lhs, p.ParseUntil(rbp))
 
 
@@ -241,8 +241,8 @@ class TdopParser(object):
   def Eat(self, token_type):
     """ Eat()? """
     if not self.AtToken(token_type):
-      p_die('Parser expected %s, got %s', token_type, self.cur_word,
-            word=self.cur_word)
+      p_die('Parser expected %s, got %s', token_type,
+            self.cur_word.PrettyTree(), word=self.cur_word)
     self.Next()
 
   def Next(self):
@@ -61,7 +61,9 @@ def AsdlEqual(left, right):
 
 
 def AssertAsdlEqual(test, left, right):
-  test.assertTrue(AsdlEqual(left, right), 'Expected %s, got %s' % (left, right))
+  test.assertTrue(
+      AsdlEqual(left, right),
+      'Expected %s, got %s' % (left.PrettyTree(), right.PrettyTree()))
 
 
 def MakeArena(source_name):
@@ -734,7 +734,7 @@ class _WordEvaluator(object):
       else:
         if self.exec_opts.strict_array:
           # Examples: echo f > "$@"; local foo="$@"
-          e_die("Expected string, got %s", part_val, word=word)
+          e_die("Expected string, got %s", part_val.PrettyTree(), word=word)
 
           # TODO: Maybe add detail like this.
           #e_die('RHS of assignment should only have strings.  '
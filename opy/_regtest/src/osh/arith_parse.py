@@ -67,7 +67,7 @@ def LeftIndex(p, w, left, unused_bp):
   3. strings don't have mutable characters.
   """
   if not tdop.IsIndexable(left):
-    p_die("%s can't be indexed", left, word=w)
+    p_die("%s can't be indexed", left.PrettyTree(), word=w)
   index = p.ParseUntil(0)
   p.Eat(Id.Arith_RBracket)
 
@@ -90,7 +90,7 @@ def LeftFuncCall(p, t, left, unused_bp):
   children = []
   # f(x) or f[i](x)
   if not tdop.IsCallable(left):
-    raise tdop.ParseError("%s can't be called" % left)
+    raise tdop.ParseError("%s can't be called" % left.PrettyTree())
   while not p.AtToken(Id.Arith_RParen):
     # We don't want to grab the comma, e.g. it is NOT a sequence operator.  So
     # set the precedence to 5.
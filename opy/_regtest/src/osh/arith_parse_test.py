@@ -33,7 +33,7 @@ def ParseAndEval(code_str):
   if not anode:
     raise ExprSyntaxError("failed %s" % w_parser.Error())
 
-  print('node:', anode)
+  print('node:', anode.PrettyTree())
 
   mem = state.Mem('', [], {}, None)
   exec_opts = state.ExecOpts(mem)
@@ -348,7 +348,8 @@ class WordParser(object):
           return None
 
       else:
-        p_die('Unexpected token %s', self.cur_token, token=self.cur_token)
+        p_die('Unexpected token %s', self.cur_token.PrettyTree(),
+              token=self.cur_token)
 
       part.suffix_op = op
 
@@ -479,7 +480,8 @@ class WordParser(object):
 
     else:
       # e.g. ${^}
-      p_die('Unexpected token %s', self.cur_token, token=self.cur_token)
+      p_die('Unexpected token %s', self.cur_token.PrettyTree(),
+            token=self.cur_token)
 
     part.spids.append(left_spid)
 
@@ -563,7 +565,7 @@ class WordParser(object):
     if self.token_type == Id.Left_ArithSub2:
       return self._ReadArithSub2Part()
 
-    raise AssertionError('%s not handled' % self.cur_token)
+    raise AssertionError('%s not handled' % self.cur_token.PrettyTree())
 
   def _ReadExtGlobPart(self):
     """
@@ -613,7 +615,8 @@ class WordParser(object):
         return None
 
       else:
-        raise AssertionError('Unexpected token %r' % self.cur_token)
+        raise AssertionError(
+            'Unexpected token %s' % self.cur_token.PrettyTree())
 
     return part
 